@@ -4,8 +4,6 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from consilium.config import Settings, get_settings
 from consilium.core.enums import AgentType, InvestmentStyle
 from consilium.core.models import AgentProfile
@@ -50,6 +48,7 @@ class AgentRegistry:
             return
 
         prompts_dir = self._settings.prompts_dir
+        self._prompt_loader.preload()
 
         # Load investor profiles
         investors_dir = prompts_dir / "investors"
@@ -74,8 +73,11 @@ class AgentRegistry:
     ) -> AgentProfile | None:
         """Load agent profile from YAML file."""
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            # Parsed once by the prompt loader and reused when the agent is built
+            if agent_type == AgentType.INVESTOR:
+                data = self._prompt_loader.load_investor_prompt(yaml_path.stem)
+            else:
+                data = self._prompt_loader.load_specialist_prompt(yaml_path.stem)
 
             # Get weight from settings override or YAML default
             weight = self._settings.weights.get_weight(data["id"])
@@ -45,14 +45,25 @@ class AskResult(BaseModel):
     execution_time_seconds: float = 0.0
     created_at: datetime = Field(default_factory=datetime.now)
 
+    def signal_counts(self) -> tuple[int, int, int]:
+        """Count bullish, neutral and bearish responses in one pass."""
+        bullish = neutral = bearish = 0
+        for r in self.responses:
+            if r.signal.is_bullish:
+                bullish += 1
+            elif r.signal.is_bearish:
+                bearish += 1
+            elif r.signal == SignalType.HOLD:
+                neutral += 1
+        return bullish, neutral, bearish
+
     @property
     def consensus_signal(self) -> Optional[SignalType]:
         """Calculate consensus signal from responses."""
         if not self.responses:
             return None
 
-        buy_votes = sum(1 for r in self.responses if r.signal.is_bullish)
-        sell_votes = sum(1 for r in self.responses if r.signal.is_bearish)
+        buy_votes, _, sell_votes = self.signal_counts()
 
         if buy_votes > sell_votes:
             return SignalType.BUY
@@ -63,14 +74,14 @@ class AskResult(BaseModel):
     @property
     def bullish_count(self) -> int:
         """Count of bullish responses."""
-        return sum(1 for r in self.responses if r.signal.is_bullish)
+        return self.signal_counts()[0]
 
     @property
     def bearish_count(self) -> int:
         """Count of bearish responses."""
-        return sum(1 for r in self.responses if r.signal.is_bearish)
+        return self.signal_counts()[2]
 
     @property
     def neutral_count(self) -> int:
         """Count of neutral (HOLD) responses."""
-        return sum(1 for r in self.responses if r.signal == SignalType.HOLD)
+        return self.signal_counts()[1]
@@ -208,7 +208,8 @@ class AskOrchestrator:
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> Decimal:
         """Calculate cost based on model pricing."""
         # Use CostEstimator pricing
-        from consilium.llm.cost_estimator import CostEstimator
+        from consilium.llm.cost_estimator import get_cost_estimator
 
-        estimator = CostEstimator(self._settings.model)
-        return estimator._calculate_cost(input_tokens, output_tokens)
+        return get_cost_estimator(self._settings.model)._calculate_cost(
+            input_tokens, output_tokens
+        )
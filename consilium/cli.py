@@ -588,7 +588,7 @@ def watchlist_create(
             repo = WatchlistRepository(pool)
 
             # Check if already exists
-            existing = await repo.get_by_name(name)
+            existing = await repo.get_metadata_by_name(name)
             if existing:
                 console.print(f"[red]Error:[/red] Watchlist '{name}' already exists.")
                 console.print("[dim]Use 'consilium watchlist add' to add tickers to existing list.[/dim]")
@@ -1263,8 +1263,8 @@ def universe_sync(
             repo = UniverseRepository(pool)
 
             # Get old count for comparison
-            existing = await repo.get_universe(name.lower())
-            old_count = len(existing.get("tickers", [])) if existing else 0
+            existing = await repo.get_universe_metadata(name.lower())
+            old_count = existing.get("ticker_count", 0) if existing else 0
 
             await repo.save_universe(
                 name=data.name,
@@ -1323,7 +1323,7 @@ def universe_delete(
         try:
             pool = await get_pool()
             repo = UniverseRepository(pool)
-            return await repo.get_universe(name.lower())
+            return await repo.get_universe_metadata(name.lower())
         finally:
             await close_pool()
 
@@ -1348,7 +1348,7 @@ def universe_delete(
         console.print(f"[red]Universe '{name}' not found in database.[/red]")
         raise typer.Exit(1)
 
-    ticker_count = len(existing.get("tickers", []))
+    ticker_count = existing.get("ticker_count", 0)
 
     if not force:
         confirm = typer.confirm(
@@ -2809,7 +2809,9 @@ def history_show(
         try:
             pool = await get_pool()
             repo = HistoryRepository(pool)
-            return await repo.get_analysis_by_id(request_id)
+            if verbose:
+                return await repo.get_analysis_by_id(request_id)
+            return await repo.get_analysis_meta_by_id(request_id)
         finally:
             await close_pool()
 
@@ -1,9 +1,11 @@
 """Configuration management for Consilium using Pydantic Settings."""
 
+from collections.abc import Mapping
 from decimal import Decimal
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -48,15 +50,20 @@ class CacheSettings(BaseSettings):
     technicals_ttl: int = 60
     info_ttl: int = 10080  # 1 week
 
-    def get_ttl(self, data_type: str) -> int:
-        """Get TTL for a specific data type."""
-        ttls = {
+    DEFAULT_TTL: ClassVar[int] = 60
+
+    def ttl_map(self) -> dict[str, int]:
+        """Get TTLs keyed by data type."""
+        return {
             "price": self.price_ttl,
             "fundamentals": self.fundamentals_ttl,
             "technicals": self.technicals_ttl,
             "info": self.info_ttl,
         }
-        return ttls.get(data_type, 60)
+
+    def get_ttl(self, data_type: str) -> int:
+        """Get TTL for a specific data type."""
+        return self.ttl_map().get(data_type, self.DEFAULT_TTL)
 
 
 class AgentWeights(BaseSettings):
@@ -169,6 +176,12 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@lru_cache(maxsize=1)
+def cache_ttls() -> Mapping[str, int]:
+    """Get cached, read-only cache TTLs (in minutes) keyed by data type."""
+    return MappingProxyType(get_settings().cache.ttl_map())
+
+
 # Convenience function for direct access
 def get_agent_weight(agent_id: str) -> Decimal:
     """Get weight for a specific agent."""
@@ -0,0 +1,27 @@
+"""Fast JSON serialization helpers backed by orjson."""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_EXPORT_OPTIONS = _DUMPS_OPTIONS | orjson.OPT_INDENT_2
+
+loads = orjson.loads
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string, falling back to str() for unknown types."""
+    return orjson.dumps(obj, default=str, option=_DUMPS_OPTIONS).decode()
+
+
+def _decimal_to_float(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize obj to two-space indented JSON bytes, writing Decimal as float."""
+    return orjson.dumps(obj, default=_decimal_to_float, option=_EXPORT_OPTIONS)
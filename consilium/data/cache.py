@@ -7,6 +7,8 @@ from consilium.data.yahoo import YahooFinanceProvider
 from consilium.db.connection import DatabasePool
 from consilium.db.repository import CacheRepository
 
+_STOCK_DATA_TYPES = ("info", "price", "fundamentals", "technicals")
+
 
 class CachedDataProvider:
     """
@@ -32,11 +34,14 @@ class CachedDataProvider:
         ticker = ticker.upper().strip()
 
         if not bypass_cache:
-            # Try to get all components from cache
-            cached_info = await self._cache.get_cached(ticker, "info")
-            cached_price = await self._cache.get_cached(ticker, "price")
-            cached_fundamentals = await self._cache.get_cached(ticker, "fundamentals")
-            cached_technicals = await self._cache.get_cached(ticker, "technicals")
+            # Try to get all components from cache in one lookup
+            cached = await self._cache.mget_cached(
+                [(ticker, data_type) for data_type in _STOCK_DATA_TYPES]
+            )
+            cached_info = cached.get((ticker, "info"))
+            cached_price = cached.get((ticker, "price"))
+            cached_fundamentals = cached.get((ticker, "fundamentals"))
+            cached_technicals = cached.get((ticker, "technicals"))
 
             if all([cached_info, cached_price, cached_fundamentals, cached_technicals]):
                 # Reconstruct Stock from cached data
@@ -61,35 +66,20 @@ class CachedDataProvider:
         """Cache all components of a stock."""
         ticker = stock.ticker
 
-        # Cache company info (longest TTL)
-        await self._cache.set_cached(
-            ticker,
-            "info",
-            {
-                "asset_class": stock.asset_class.value,
-                "company": stock.company.model_dump(),
-            },
-        )
-
-        # Cache price data (shortest TTL)
-        await self._cache.set_cached(
-            ticker,
-            "price",
-            stock.price.model_dump(),
-        )
-
-        # Cache fundamentals
-        await self._cache.set_cached(
-            ticker,
-            "fundamentals",
-            stock.fundamentals.model_dump(),
-        )
-
-        # Cache technicals
-        await self._cache.set_cached(
-            ticker,
-            "technicals",
-            stock.technicals.model_dump(),
+        await self._cache.mset_cached(
+            [
+                (
+                    ticker,
+                    "info",
+                    {
+                        "asset_class": stock.asset_class.value,
+                        "company": stock.company.model_dump(),
+                    },
+                ),
+                (ticker, "price", stock.price.model_dump()),
+                (ticker, "fundamentals", stock.fundamentals.model_dump()),
+                (ticker, "technicals", stock.technicals.model_dump()),
+            ]
         )
 
     async def get_price(self, ticker: str, bypass_cache: bool = False) -> StockPrice:
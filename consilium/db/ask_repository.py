@@ -74,9 +74,9 @@ class AskRepository:
                             (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                     """
 
-                    for response in result.responses:
-                        await cursor.execute(
-                            response_query,
+                    await cursor.executemany(
+                        response_query,
+                        [
                             (
                                 question_id,
                                 response.agent_id,
@@ -91,8 +91,10 @@ class AskRepository:
                                 response.input_tokens,
                                 response.output_tokens,
                                 result.created_at,
-                            ),
-                        )
+                            )
+                            for response in result.responses
+                        ],
+                    )
 
                 await conn.commit()
                 return question_id
@@ -64,6 +64,18 @@ class DatabasePool:
         async with self._pool.acquire() as conn:
             yield conn
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[aiomysql.Connection, None]:
+        """Acquire a connection and run the enclosed statements as one transaction."""
+        async with self.acquire() as conn:
+            await conn.begin()
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            await conn.commit()
+
     async def execute(
         self, query: str, params: tuple[Any, ...] | None = None
     ) -> tuple[int, int]:
@@ -73,6 +85,17 @@ class DatabasePool:
                 await cur.execute(query, params)
                 return cur.rowcount, cur.lastrowid
 
+    async def execute_many(
+        self, query: str, params_seq: list[tuple[Any, ...]]
+    ) -> int:
+        """Execute a query for each parameter tuple in one batch and return affected_rows."""
+        if not params_seq:
+            return 0
+        async with self.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany(query, params_seq)
+                return cur.rowcount
+
     async def fetch_one(
         self, query: str, params: tuple[Any, ...] | None = None
     ) -> dict[str, Any] | None:
@@ -3,7 +3,7 @@
 from consilium.db.connection import DatabasePool
 
 
-SCHEMA_VERSION = 6
+SCHEMA_VERSION = 10
 
 MIGRATIONS = {
     1: """
@@ -458,6 +458,65 @@ CREATE TABLE IF NOT EXISTS backtest_snapshots (
 
 -- Record version 6
 INSERT INTO schema_versions (version, description) VALUES (6, 'Backtesting engine');
+""",
+    7: """
+-- Migration v7: Covering indexes for metadata lookups
+-- Lets universe listing and metadata lookups be served from the index alone
+
+ALTER TABLE stock_universes
+ADD INDEX idx_name_metadata (name, ticker_count, last_updated, description);
+
+-- Record version 7
+INSERT INTO schema_versions (version, description) VALUES (7, 'Covering indexes for metadata lookups');
+""",
+    8: """
+-- Migration v8: Server-side cache timestamps
+-- fetched_at defaults to the insert time and expires_at is derived from ttl_minutes
+
+ALTER TABLE market_data_cache
+MODIFY COLUMN fetched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ADD COLUMN ttl_minutes INT NOT NULL DEFAULT 0 AFTER data_json;
+
+ALTER TABLE market_data_cache DROP COLUMN expires_at;
+
+ALTER TABLE market_data_cache
+ADD COLUMN expires_at TIMESTAMP
+    GENERATED ALWAYS AS (fetched_at + INTERVAL ttl_minutes MINUTE) STORED AFTER fetched_at,
+ADD INDEX idx_expires (expires_at);
+
+-- Record version 8
+INSERT INTO schema_versions (version, description) VALUES (8, 'Server-side cache timestamps');
+""",
+    9: """
+-- Migration v9: Composite index for agent history lookups
+-- Matches the WHERE/JOIN of get_agent_history
+
+-- get_agent_history: agent_id [+ ticker], joined to analysis_history by analysis_id
+ALTER TABLE agent_responses
+ADD INDEX idx_agent_ticker_analysis (agent_id, ticker, analysis_id);
+
+-- Record version 9
+INSERT INTO schema_versions (version, description) VALUES (9, 'Composite index for agent history lookups');
+""",
+    10: """
+-- Migration v10: One cache row per ticker/data_type
+-- set_cached becomes an upsert, so reads are point lookups with no sort
+
+-- Keep only the newest row for each key. The grouped derived table is
+-- materialized, so MySQL allows it to read the table being deleted from.
+DELETE FROM market_data_cache
+WHERE id NOT IN (
+    SELECT id FROM (
+        SELECT MAX(id) AS id FROM market_data_cache GROUP BY ticker, data_type
+    ) AS newest
+);
+
+ALTER TABLE market_data_cache
+ADD UNIQUE KEY idx_ticker_type_unique (ticker, data_type),
+DROP INDEX idx_ticker_type;
+
+-- Record version 10
+INSERT INTO schema_versions (version, description) VALUES (10, 'One cache row per ticker/data_type');
 """,
 }
 
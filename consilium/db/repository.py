@@ -1,38 +1,302 @@
 """Data access layer (DAO pattern) for Consilium."""
 
-import json
-from datetime import datetime, timedelta
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Final
 
-from consilium.config import get_settings
+from pymysql.err import InterfaceError, OperationalError
+
+from consilium.config import CacheSettings, cache_ttls
 from consilium.core.models import AnalysisResult, ConsensusResult, AgentResponse
+from consilium.core.serialization import dumps, loads
 from consilium.db.connection import DatabasePool
 
+logger = logging.getLogger(__name__)
+
+
+# INSERT/UPSERT templates shared by the hot write paths. aiomysql interpolates
+# parameters client-side, so reusing one string object per statement is
+# the closest equivalent to a prepared-statement cache.
+# Also batched by mset_cached, so it keeps the VALUES(col) form that aiomysql
+# can rewrite into a multi-row INSERT (see _UPSERT_PRICE_SQL).
+_UPSERT_CACHE_SQL: Final = """
+    INSERT INTO market_data_cache
+    (ticker, data_type, data_json, ttl_minutes)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+    data_json = VALUES(data_json), ttl_minutes = VALUES(ttl_minutes),
+    fetched_at = CURRENT_TIMESTAMP
+"""
+
+_INSERT_ANALYSIS_SQL: Final = """
+    INSERT INTO analysis_history
+    (request_id, tickers, results_json, agents_used, execution_time_ms,
+     consensus_signal, consensus_score, consensus_confidence)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_INSERT_AGENT_RESPONSE_SQL: Final = """
+    INSERT INTO agent_responses
+    (analysis_id, agent_id, ticker, `signal`, confidence,
+     target_price, reasoning, key_factors, risks)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_INSERT_SPECIALIST_REPORT_SQL: Final = """
+    INSERT INTO specialist_reports
+    (analysis_id, specialist_id, ticker, summary, analysis, score, metrics)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+# Batched through execute_many: aiomysql only rewrites it into one multi-row
+# INSERT if it matches RE_INSERT_VALUES, which a row alias after VALUES (...)
+# breaks, so the update refers to VALUES(col) instead.
+_UPSERT_PRICE_SQL: Final = """
+    INSERT INTO price_history
+    (ticker, date, open, high, low, close, adj_close, volume)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+    close = VALUES(close), adj_close = VALUES(adj_close), volume = VALUES(volume)
+"""
+
+
+# Static read/delete statements, grouped by repository. Queries whose shape
+# depends on the arguments (optional filters, IN lists) stay inline.
+
+# CacheRepository
+_SELECT_CACHE_SQL: Final = """
+    SELECT data_json, TIMESTAMPDIFF(SECOND, NOW(), expires_at) AS ttl_seconds
+    FROM market_data_cache
+    WHERE ticker = %s AND data_type = %s
+    AND expires_at > NOW()
+"""
+
+_DELETE_CACHE_TYPE_SQL: Final = "DELETE FROM market_data_cache WHERE ticker = %s AND data_type = %s"
+
+_DELETE_CACHE_TICKER_SQL: Final = "DELETE FROM market_data_cache WHERE ticker = %s"
+
+_DELETE_EXPIRED_CACHE_SQL: Final = (
+    "DELETE FROM market_data_cache WHERE expires_at < NOW() ORDER BY expires_at LIMIT %s"
+)
+
+# HistoryRepository
+_SELECT_RECENT_ANALYSES_SQL: Final = """
+    SELECT request_id, tickers, agents_used, execution_time_ms,
+           consensus_signal, consensus_score, consensus_confidence,
+           created_at
+    FROM analysis_history
+    ORDER BY created_at DESC
+    LIMIT %s
+"""
+
+_SELECT_ANALYSIS_SQL: Final = """
+    SELECT request_id, tickers, results_json, agents_used, execution_time_ms,
+           consensus_signal, consensus_score, consensus_confidence, created_at
+    FROM analysis_history
+    WHERE request_id = %s
+"""
+
+_SELECT_ANALYSIS_META_SQL: Final = """
+    SELECT request_id, tickers, agents_used, execution_time_ms,
+           consensus_signal, consensus_score, consensus_confidence, created_at
+    FROM analysis_history
+    WHERE request_id = %s
+"""
+
+_SELECT_TICKER_HISTORY_SQL: Final = """
+    SELECT ah.request_id, ah.consensus_signal, ah.consensus_score,
+           ah.consensus_confidence, ah.created_at
+    FROM analysis_history ah
+    WHERE JSON_CONTAINS(ah.tickers, %s)
+    ORDER BY ah.created_at DESC
+    LIMIT %s
+"""
+
+_SELECT_SIGNAL_DISTRIBUTION_SQL: Final = """
+    SELECT consensus_signal, COUNT(*) as count
+    FROM analysis_history
+    WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+    AND consensus_signal IS NOT NULL
+    GROUP BY consensus_signal
+"""
+
+_SELECT_AGENT_TICKER_HISTORY_SQL: Final = """
+    SELECT ar.agent_id, ar.ticker, ar.`signal`, ar.confidence,
+           ar.target_price, ar.reasoning, ar.key_factors, ar.risks,
+           ah.request_id, ah.created_at as analysis_date
+    FROM agent_responses ar
+    JOIN analysis_history ah ON ar.analysis_id = ah.id
+    WHERE ar.agent_id = %s AND ar.ticker = %s
+    ORDER BY ah.created_at DESC
+    LIMIT %s
+"""
+
+_SELECT_AGENT_HISTORY_SQL: Final = """
+    SELECT ar.agent_id, ar.ticker, ar.`signal`, ar.confidence,
+           ar.target_price, ar.reasoning, ar.key_factors, ar.risks,
+           ah.request_id, ah.created_at as analysis_date
+    FROM agent_responses ar
+    JOIN analysis_history ah ON ar.analysis_id = ah.id
+    WHERE ar.agent_id = %s
+    ORDER BY ah.created_at DESC
+    LIMIT %s
+"""
+
+# WatchlistRepository
+_INSERT_WATCHLIST_SQL: Final = """
+    INSERT INTO watchlists (name, description, tickers)
+    VALUES (%s, %s, %s)
+"""
+
+_SELECT_WATCHLIST_SQL: Final = """
+    SELECT id, name, description, tickers, created_at, updated_at,
+           last_analyzed_at, analysis_schedule
+    FROM watchlists
+    WHERE name = %s
+"""
+
+_SELECT_WATCHLIST_META_SQL: Final = """
+    SELECT id, name, description, created_at, updated_at,
+           last_analyzed_at, analysis_schedule
+    FROM watchlists
+    WHERE name = %s
+"""
+
+_SELECT_WATCHLISTS_SQL: Final = """
+    SELECT id, name, description, created_at, updated_at
+    FROM watchlists
+    ORDER BY name
+"""
+
+_ADD_WATCHLIST_TICKERS_SQL: Final = """
+    UPDATE watchlists
+    SET tickers = JSON_MERGE_PRESERVE(tickers, COALESCE((
+        SELECT JSON_ARRAYAGG(jt.ticker)
+        FROM JSON_TABLE(CAST(%s AS JSON), '$[*]' COLUMNS (ticker VARCHAR(20) PATH '$')) AS jt
+        WHERE NOT JSON_CONTAINS(tickers, JSON_QUOTE(jt.ticker))
+    ), JSON_ARRAY()))
+    WHERE name = %s
+"""
+
+_REMOVE_WATCHLIST_TICKERS_SQL: Final = """
+    UPDATE watchlists
+    SET tickers = COALESCE((
+        SELECT JSON_ARRAYAGG(jt.ticker)
+        FROM JSON_TABLE(tickers, '$[*]' COLUMNS (ticker VARCHAR(20) PATH '$')) AS jt
+        WHERE NOT JSON_CONTAINS(CAST(%s AS JSON), JSON_QUOTE(jt.ticker))
+    ), JSON_ARRAY())
+    WHERE name = %s
+"""
+
+_WATCHLIST_EXISTS_SQL: Final = "SELECT 1 FROM watchlists WHERE name = %s"
+
+_DELETE_WATCHLIST_SQL: Final = "DELETE FROM watchlists WHERE name = %s"
+
+# AgentConfigRepository
+_SELECT_AGENT_CONFIG_SQL: Final = """
+    SELECT agent_id, weight, enabled, custom_config, updated_at
+    FROM agent_config
+    WHERE agent_id = %s
+"""
+
+_UPSERT_AGENT_WEIGHT_SQL: Final = """
+    INSERT INTO agent_config (agent_id, weight)
+    VALUES (%s, %s) AS new_values
+    ON DUPLICATE KEY UPDATE weight = new_values.weight
+"""
+
+_UPSERT_AGENT_ENABLED_SQL: Final = """
+    INSERT INTO agent_config (agent_id, enabled)
+    VALUES (%s, %s) AS new_values
+    ON DUPLICATE KEY UPDATE enabled = new_values.enabled
+"""
+
+_SELECT_AGENT_OVERRIDES_SQL: Final = "SELECT * FROM agent_config"
+
+# PriceHistoryRepository
+_SELECT_LATEST_PRICE_SQL: Final = """
+    SELECT ticker, date, open, high, low, close, adj_close, volume
+    FROM price_history
+    WHERE ticker = %s
+    ORDER BY date DESC
+    LIMIT 1
+"""
+
+_COUNT_PRICES_SQL: Final = """
+    SELECT COUNT(*) as count
+    FROM price_history
+    WHERE ticker = %s AND date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
+"""
+
+# UniverseRepository
+_SELECT_UNIVERSE_SQL: Final = """
+    SELECT id, name, description, tickers, source_url, ticker_count,
+           last_updated, created_at
+    FROM stock_universes
+    WHERE name = %s
+"""
+
+_SELECT_UNIVERSE_META_SQL: Final = """
+    SELECT name, description, ticker_count, last_updated
+    FROM stock_universes
+    WHERE name = %s
+"""
+
+_UPSERT_UNIVERSE_SQL: Final = """
+    INSERT INTO stock_universes (name, description, tickers, source_url, ticker_count)
+    VALUES (%s, %s, %s, %s, %s) AS new_values
+    ON DUPLICATE KEY UPDATE
+    tickers = new_values.tickers, description = new_values.description,
+    source_url = new_values.source_url, ticker_count = new_values.ticker_count
+"""
+
+_SELECT_UNIVERSES_SQL: Final = """
+    SELECT name, description, ticker_count, last_updated
+    FROM stock_universes
+    ORDER BY name
+"""
+
+_DELETE_UNIVERSE_SQL: Final = "DELETE FROM stock_universes WHERE name = %s"
+
 
 class CacheRepository:
-    """Repository for market data caching operations."""
+    """Repository for market data caching operations.
+
+    Encoded entries are also kept in a small in-process LRU so repeated
+    lookups within a run skip the database round trip. Each hit decodes a
+    fresh dict, so callers may mutate what they get back.
+    Local entries never outlive the database row or LOCAL_CACHE_TTL_SECONDS.
+    """
+
+    LOCAL_CACHE_SIZE = 1024
+    LOCAL_CACHE_TTL_SECONDS = 60.0
+    CLEANUP_BATCH_SIZE = 1000
 
     def __init__(self, pool: DatabasePool) -> None:
         self._pool = pool
-        self._settings = get_settings()
+        self._ttls = cache_ttls()
+        self._local: OrderedDict[tuple[str, str], tuple[float, str | bytes]] = OrderedDict()
 
     async def get_cached(
         self, ticker: str, data_type: str
     ) -> dict[str, Any] | None:
         """Retrieve cached data if not expired."""
+        key = (ticker.upper(), data_type)
+        data = self._recall(key)
+        if data is not None:
+            return data
+
         result = await self._pool.fetch_one(
-            """
-            SELECT data_json, expires_at
-            FROM market_data_cache
-            WHERE ticker = %s AND data_type = %s
-            AND expires_at > NOW()
-            ORDER BY fetched_at DESC LIMIT 1
-            """,
-            (ticker.upper(), data_type),
+            _SELECT_CACHE_SQL,
+            key,
         )
         if result:
-            return json.loads(result["data_json"])
+            self._remember(key, result["data_json"], result["ttl_seconds"])
+            return loads(result["data_json"])
         return None
 
     async def set_cached(
@@ -43,40 +307,132 @@ class CacheRepository:
         ttl_minutes: int | None = None,
     ) -> None:
         """Store data in cache with TTL."""
-        ttl = ttl_minutes or self._settings.cache.get_ttl(data_type)
-        expires_at = datetime.utcnow() + timedelta(minutes=ttl)
+        ttl = ttl_minutes or self._ttl(data_type)
+        key = (ticker.upper(), data_type)
 
+        encoded = dumps(data)
         await self._pool.execute(
-            """
-            INSERT INTO market_data_cache
-            (ticker, data_type, data_json, fetched_at, expires_at)
-            VALUES (%s, %s, %s, NOW(), %s)
+            _UPSERT_CACHE_SQL,
+            (*key, encoded, ttl),
+        )
+        self._remember(key, encoded, ttl * 60)
+
+    async def mget_cached(
+        self, keys: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Retrieve several (ticker, data_type) entries in one query. Misses are omitted."""
+        found: dict[tuple[str, str], dict[str, Any]] = {}
+        missing: list[tuple[str, str]] = []
+        for ticker, data_type in keys:
+            key = (ticker.upper(), data_type)
+            data = self._recall(key)
+            if data is not None:
+                found[key] = data
+            else:
+                missing.append(key)
+
+        if not missing:
+            return found
+
+        placeholders = ", ".join(["(%s, %s)"] * len(missing))
+        results = await self._pool.fetch_all(
+            f"""
+            SELECT ticker, data_type, data_json,
+                   TIMESTAMPDIFF(SECOND, NOW(), expires_at) AS ttl_seconds
+            FROM market_data_cache
+            WHERE (ticker, data_type) IN ({placeholders})
+            AND expires_at > NOW()
             """,
-            (ticker.upper(), data_type, json.dumps(data, default=str), expires_at),
+            tuple(value for key in missing for value in key),
         )
+        for r in results:
+            key = (r["ticker"], r["data_type"])
+            self._remember(key, r["data_json"], r["ttl_seconds"])
+            found[key] = loads(r["data_json"])
+        return found
+
+    async def mset_cached(
+        self,
+        entries: list[tuple[str, str, dict[str, Any]]],
+        ttl_minutes: int | None = None,
+    ) -> None:
+        """Store several (ticker, data_type, data) entries in one batch."""
+        rows = [
+            (
+                ticker.upper(),
+                data_type,
+                dumps(data),
+                ttl_minutes or self._ttl(data_type),
+            )
+            for ticker, data_type, data in entries
+        ]
+        await self._pool.execute_many(_UPSERT_CACHE_SQL, rows)
+        for ticker, data_type, encoded, ttl in rows:
+            self._remember((ticker, data_type), encoded, ttl * 60)
 
     async def invalidate(
         self, ticker: str, data_type: str | None = None
     ) -> int:
         """Invalidate cached data for a ticker. Returns rows deleted."""
+        ticker = ticker.upper()
+        for key in [k for k in self._local if k[0] == ticker and data_type in (None, k[1])]:
+            del self._local[key]
+
         if data_type:
             rows, _ = await self._pool.execute(
-                "DELETE FROM market_data_cache WHERE ticker = %s AND data_type = %s",
-                (ticker.upper(), data_type),
+                _DELETE_CACHE_TYPE_SQL,
+                (ticker, data_type),
             )
         else:
             rows, _ = await self._pool.execute(
-                "DELETE FROM market_data_cache WHERE ticker = %s",
-                (ticker.upper(),),
+                _DELETE_CACHE_TICKER_SQL,
+                (ticker,),
             )
         return rows
 
+    def _ttl(self, data_type: str) -> int:
+        """Return the configured TTL in minutes for a data type."""
+        return self._ttls.get(data_type, CacheSettings.DEFAULT_TTL)
+
+    def _recall(self, key: tuple[str, str]) -> dict[str, Any] | None:
+        """Decode a live entry from the local LRU, dropping it if expired."""
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires, encoded = entry
+        if expires <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return loads(encoded)
+
+    def _remember(
+        self, key: tuple[str, str], encoded: str | bytes, ttl_seconds: float
+    ) -> None:
+        """Store an encoded entry in the local LRU, evicting the oldest if full."""
+        ttl = min(float(ttl_seconds), self.LOCAL_CACHE_TTL_SECONDS)
+        if ttl <= 0:
+            return
+        self._local[key] = (time.monotonic() + ttl, encoded)
+        self._local.move_to_end(key)
+        if len(self._local) > self.LOCAL_CACHE_SIZE:
+            self._local.popitem(last=False)
+
     async def cleanup_expired(self) -> int:
-        """Remove all expired cache entries. Returns rows deleted."""
-        rows, _ = await self._pool.execute(
-            "DELETE FROM market_data_cache WHERE expires_at < NOW()"
-        )
-        return rows
+        """Remove all expired cache entries. Returns rows deleted.
+
+        Deletes in batches of CLEANUP_BATCH_SIZE so each statement holds its
+        locks briefly and cache writes can interleave.
+        """
+        total = 0
+        while True:
+            rows, _ = await self._pool.execute(
+                _DELETE_EXPIRED_CACHE_SQL, (self.CLEANUP_BATCH_SIZE,)
+            )
+            total += rows
+            if rows < self.CLEANUP_BATCH_SIZE:
+                return total
+            await asyncio.sleep(0)
 
 
 class HistoryRepository:
@@ -96,71 +452,64 @@ class HistoryRepository:
         if result.results:
             first_consensus = result.results[0]
             consensus_signal = first_consensus.final_signal.value
-            consensus_score = round(float(first_consensus.weighted_score), 2)
+            consensus_score = round(first_consensus.weighted_score, 2)
             consensus_confidence = first_consensus.confidence.value
 
-        # Insert main analysis record with consensus fields
-        _, analysis_id = await self._pool.execute(
-            """
-            INSERT INTO analysis_history
-            (request_id, tickers, results_json, agents_used, execution_time_ms,
-             consensus_signal, consensus_score, consensus_confidence)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """,
-            (
-                result.request_id,
-                json.dumps(result.tickers),
-                result.model_dump_json(),
-                result.agents_used,
-                int(result.execution_time_seconds * 1000),
-                consensus_signal,
-                consensus_score,
-                consensus_confidence,
-            ),
-        )
+        tickers_json = dumps(result.tickers)
+        results_json = result.model_dump_json()
+
+        async with self._pool.transaction() as conn:
+            async with conn.cursor() as cur:
+                # Insert main analysis record with consensus fields
+                await cur.execute(
+                    _INSERT_ANALYSIS_SQL,
+                    (
+                        result.request_id,
+                        tickers_json,
+                        results_json,
+                        result.agents_used,
+                        int(result.execution_time_seconds * 1000),
+                        consensus_signal,
+                        consensus_score,
+                        consensus_confidence,
+                    ),
+                )
+                analysis_id = cur.lastrowid
 
-        # Save individual agent responses and specialist reports
-        for consensus in result.results:
-            # Save agent responses
-            for response in consensus.agent_responses:
-                await self._pool.execute(
-                    """
-                    INSERT INTO agent_responses
-                    (analysis_id, agent_id, ticker, `signal`, confidence,
-                     target_price, reasoning, key_factors, risks)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
+                # Save individual agent responses and specialist reports, one batch per table
+                agent_rows = [
                     (
                         analysis_id,
                         response.agent_id,
                         response.ticker,
                         response.signal.value,
                         response.confidence.value,
-                        float(response.target_price) if response.target_price else None,
+                        response.target_price or None,
                         response.reasoning,
-                        json.dumps(response.key_factors),
-                        json.dumps(response.risks),
-                    ),
-                )
-
-            # Save specialist reports
-            for report in consensus.specialist_reports:
-                await self._pool.execute(
-                    """
-                    INSERT INTO specialist_reports
-                    (analysis_id, specialist_id, ticker, summary, analysis, score, metrics)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """,
+                        dumps(response.key_factors),
+                        dumps(response.risks),
+                    )
+                    for consensus in result.results
+                    for response in consensus.agent_responses
+                ]
+                report_rows = [
                     (
                         analysis_id,
                         report.specialist_id,
                         report.ticker,
                         report.summary,
                         report.analysis,
-                        float(report.score) if report.score else None,
-                        json.dumps(report.metrics) if report.metrics else None,
-                    ),
-                )
+                        report.score or None,
+                        dumps(report.metrics) if report.metrics else None,
+                    )
+                    for consensus in result.results
+                    for report in consensus.specialist_reports
+                ]
+
+                if agent_rows:
+                    await cur.executemany(_INSERT_AGENT_RESPONSE_SQL, agent_rows)
+                if report_rows:
+                    await cur.executemany(_INSERT_SPECIALIST_REPORT_SQL, report_rows)
 
         return analysis_id
 
@@ -169,20 +518,13 @@ class HistoryRepository:
     ) -> list[dict[str, Any]]:
         """Get recent analysis summaries."""
         results = await self._pool.fetch_all(
-            """
-            SELECT request_id, tickers, agents_used, execution_time_ms,
-                   consensus_signal, consensus_score, consensus_confidence,
-                   created_at
-            FROM analysis_history
-            ORDER BY created_at DESC
-            LIMIT %s
-            """,
+            _SELECT_RECENT_ANALYSES_SQL,
             (limit,),
         )
         # Parse tickers JSON
         for r in results:
             if r.get("tickers"):
-                r["tickers"] = json.loads(r["tickers"])
+                r["tickers"] = loads(r["tickers"])
         return results
 
     async def get_history(
@@ -198,7 +540,7 @@ class HistoryRepository:
 
         if ticker:
             conditions.append("JSON_CONTAINS(tickers, %s)")
-            params.append(json.dumps(ticker.upper()))
+            params.append(dumps(ticker.upper()))
 
         if days:
             conditions.append("created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)")
@@ -226,26 +568,33 @@ class HistoryRepository:
         # Parse tickers JSON
         for r in results:
             if r.get("tickers"):
-                r["tickers"] = json.loads(r["tickers"])
+                r["tickers"] = loads(r["tickers"])
         return results
 
     async def get_analysis_by_id(
         self, request_id: str
     ) -> dict[str, Any] | None:
-        """Get full analysis by request ID."""
+        """Get full analysis by request ID, including the decoded results_json."""
         result = await self._pool.fetch_one(
-            """
-            SELECT request_id, tickers, results_json, agents_used, execution_time_ms,
-                   consensus_signal, consensus_score, consensus_confidence, created_at
-            FROM analysis_history
-            WHERE request_id = %s
-            """,
+            _SELECT_ANALYSIS_SQL,
             (request_id,),
         )
         if result and result.get("tickers"):
-            result["tickers"] = json.loads(result["tickers"])
+            result["tickers"] = loads(result["tickers"])
         if result and result.get("results_json"):
-            result["results_json"] = json.loads(result["results_json"])
+            result["results_json"] = loads(result["results_json"])
+        return result
+
+    async def get_analysis_meta_by_id(
+        self, request_id: str
+    ) -> dict[str, Any] | None:
+        """Get analysis summary by request ID, without the results_json payload."""
+        result = await self._pool.fetch_one(
+            _SELECT_ANALYSIS_META_SQL,
+            (request_id,),
+        )
+        if result and result.get("tickers"):
+            result["tickers"] = loads(result["tickers"])
         return result
 
     async def get_ticker_history(
@@ -253,15 +602,8 @@ class HistoryRepository:
     ) -> list[dict[str, Any]]:
         """Get analysis history for a specific ticker."""
         results = await self._pool.fetch_all(
-            """
-            SELECT ah.request_id, ah.consensus_signal, ah.consensus_score,
-                   ah.consensus_confidence, ah.created_at
-            FROM analysis_history ah
-            WHERE JSON_CONTAINS(ah.tickers, %s)
-            ORDER BY ah.created_at DESC
-            LIMIT %s
-            """,
-            (json.dumps(ticker.upper()), limit),
+            _SELECT_TICKER_HISTORY_SQL,
+            (dumps(ticker.upper()), limit),
         )
         return results
 
@@ -270,13 +612,7 @@ class HistoryRepository:
     ) -> dict[str, int]:
         """Get distribution of signals over a period."""
         results = await self._pool.fetch_all(
-            """
-            SELECT consensus_signal, COUNT(*) as count
-            FROM analysis_history
-            WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            AND consensus_signal IS NOT NULL
-            GROUP BY consensus_signal
-            """,
+            _SELECT_SIGNAL_DISTRIBUTION_SQL,
             (days,),
         )
         return {r["consensus_signal"]: r["count"] for r in results}
@@ -287,26 +623,12 @@ class HistoryRepository:
         """Get historical responses for a specific agent."""
         if ticker:
             return await self._pool.fetch_all(
-                """
-                SELECT ar.*, ah.created_at as analysis_date
-                FROM agent_responses ar
-                JOIN analysis_history ah ON ar.analysis_id = ah.id
-                WHERE ar.agent_id = %s AND ar.ticker = %s
-                ORDER BY ah.created_at DESC
-                LIMIT %s
-                """,
+                _SELECT_AGENT_TICKER_HISTORY_SQL,
                 (agent_id, ticker.upper(), limit),
             )
         else:
             return await self._pool.fetch_all(
-                """
-                SELECT ar.*, ah.created_at as analysis_date
-                FROM agent_responses ar
-                JOIN analysis_history ah ON ar.analysis_id = ah.id
-                WHERE ar.agent_id = %s
-                ORDER BY ah.created_at DESC
-                LIMIT %s
-                """,
+                _SELECT_AGENT_HISTORY_SQL,
                 (agent_id, limit),
             )
 
@@ -322,65 +644,58 @@ class WatchlistRepository:
     ) -> int:
         """Create a new watchlist. Returns watchlist_id."""
         _, wl_id = await self._pool.execute(
-            """
-            INSERT INTO watchlists (name, description, tickers)
-            VALUES (%s, %s, %s)
-            """,
-            (name, description, json.dumps([t.upper() for t in tickers])),
+            _INSERT_WATCHLIST_SQL,
+            (name, description, dumps([t.upper() for t in tickers])),
         )
         return wl_id
 
     async def get_by_name(self, name: str) -> dict[str, Any] | None:
         """Get watchlist by name."""
         result = await self._pool.fetch_one(
-            "SELECT * FROM watchlists WHERE name = %s",
+            _SELECT_WATCHLIST_SQL,
             (name,),
         )
         if result and result.get("tickers"):
-            result["tickers"] = json.loads(result["tickers"])
+            result["tickers"] = loads(result["tickers"])
         return result
 
+    async def get_metadata_by_name(self, name: str) -> dict[str, Any] | None:
+        """Get watchlist metadata by name, without the tickers payload."""
+        return await self._pool.fetch_one(
+            _SELECT_WATCHLIST_META_SQL,
+            (name,),
+        )
+
     async def list_all(self) -> list[dict[str, Any]]:
         """List all watchlists."""
         results = await self._pool.fetch_all(
-            "SELECT id, name, description, created_at, updated_at FROM watchlists ORDER BY name"
+            _SELECT_WATCHLISTS_SQL
         )
         return results
 
     async def add_tickers(self, name: str, tickers: list[str]) -> bool:
         """Add tickers to an existing watchlist."""
-        wl = await self.get_by_name(name)
-        if not wl:
-            return False
-
-        existing = set(wl.get("tickers", []))
-        new_tickers = existing | {t.upper() for t in tickers}
-
-        await self._pool.execute(
-            "UPDATE watchlists SET tickers = %s WHERE name = %s",
-            (json.dumps(list(new_tickers)), name),
-        )
-        return True
+        return await self._update_tickers(_ADD_WATCHLIST_TICKERS_SQL, name, tickers)
 
     async def remove_tickers(self, name: str, tickers: list[str]) -> bool:
         """Remove tickers from a watchlist."""
-        wl = await self.get_by_name(name)
-        if not wl:
-            return False
-
-        existing = set(wl.get("tickers", []))
-        remaining = existing - {t.upper() for t in tickers}
-
-        await self._pool.execute(
-            "UPDATE watchlists SET tickers = %s WHERE name = %s",
-            (json.dumps(list(remaining)), name),
-        )
-        return True
+        return await self._update_tickers(_REMOVE_WATCHLIST_TICKERS_SQL, name, tickers)
+
+    async def _update_tickers(self, query: str, name: str, tickers: list[str]) -> bool:
+        """Run a ticker UPDATE and report whether the watchlist exists."""
+        async with self._pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query, (dumps(sorted({t.upper() for t in tickers})), name))
+                if cur.rowcount > 0:
+                    return True
+                # Nothing changed: either no such watchlist or the tickers were a no-op
+                await cur.execute(_WATCHLIST_EXISTS_SQL, (name,))
+                return await cur.fetchone() is not None
 
     async def delete(self, name: str) -> bool:
         """Delete a watchlist."""
         rows, _ = await self._pool.execute(
-            "DELETE FROM watchlists WHERE name = %s",
+            _DELETE_WATCHLIST_SQL,
             (name,),
         )
         return rows > 0
@@ -395,35 +710,27 @@ class AgentConfigRepository:
     async def get_config(self, agent_id: str) -> dict[str, Any] | None:
         """Get agent configuration override."""
         return await self._pool.fetch_one(
-            "SELECT * FROM agent_config WHERE agent_id = %s",
+            _SELECT_AGENT_CONFIG_SQL,
             (agent_id,),
         )
 
     async def set_weight(self, agent_id: str, weight: Decimal) -> None:
         """Set agent weight override."""
         await self._pool.execute(
-            """
-            INSERT INTO agent_config (agent_id, weight)
-            VALUES (%s, %s) AS new_values
-            ON DUPLICATE KEY UPDATE weight = new_values.weight
-            """,
-            (agent_id, float(weight)),
+            _UPSERT_AGENT_WEIGHT_SQL,
+            (agent_id, weight),
         )
 
     async def set_enabled(self, agent_id: str, enabled: bool) -> None:
         """Enable or disable an agent."""
         await self._pool.execute(
-            """
-            INSERT INTO agent_config (agent_id, enabled)
-            VALUES (%s, %s) AS new_values
-            ON DUPLICATE KEY UPDATE enabled = new_values.enabled
-            """,
+            _UPSERT_AGENT_ENABLED_SQL,
             (agent_id, enabled),
         )
 
     async def get_all_overrides(self) -> list[dict[str, Any]]:
         """Get all agent configuration overrides."""
-        return await self._pool.fetch_all("SELECT * FROM agent_config")
+        return await self._pool.fetch_all(_SELECT_AGENT_OVERRIDES_SQL)
 
 
 class PriceHistoryRepository:
@@ -439,31 +746,45 @@ class PriceHistoryRepository:
         if not prices:
             return 0
 
+        symbol = ticker.upper()
+        rows = [
+            (
+                symbol,
+                price["date"],
+                price.get("open"),
+                price.get("high"),
+                price.get("low"),
+                price["close"],
+                price.get("adj_close"),
+                price.get("volume"),
+            )
+            for price in prices
+            if "date" in price and "close" in price
+        ]
+
+        try:
+            await self._pool.execute_many(_UPSERT_PRICE_SQL, rows)
+            return len(rows)
+        except (OperationalError, InterfaceError):
+            # Connection-level failure: retrying row by row would only fail again
+            raise
+        except Exception:
+            logger.warning(
+                "Batch price insert for %s failed; retrying row by row",
+                symbol,
+                exc_info=True,
+            )
+
+        # Batch failed: fall back to row-by-row so one bad row doesn't drop the rest
         inserted = 0
-        for price in prices:
+        for row in rows:
             try:
-                await self._pool.execute(
-                    """
-                    INSERT INTO price_history
-                    (ticker, date, open, high, low, close, adj_close, volume)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s) AS new_values
-                    ON DUPLICATE KEY UPDATE
-                    close = new_values.close, adj_close = new_values.adj_close, volume = new_values.volume
-                    """,
-                    (
-                        ticker.upper(),
-                        price["date"],
-                        price.get("open"),
-                        price.get("high"),
-                        price.get("low"),
-                        price["close"],
-                        price.get("adj_close"),
-                        price.get("volume"),
-                    ),
-                )
+                await self._pool.execute(_UPSERT_PRICE_SQL, row)
                 inserted += 1
+            except (OperationalError, InterfaceError):
+                raise
             except Exception:
-                continue
+                logger.debug("Skipping price row %s for %s", row[1], symbol, exc_info=True)
         return inserted
 
     async def get_prices(
@@ -502,24 +823,14 @@ class PriceHistoryRepository:
     async def get_latest_price(self, ticker: str) -> dict[str, Any] | None:
         """Get the most recent price for a ticker."""
         return await self._pool.fetch_one(
-            """
-            SELECT ticker, date, open, high, low, close, adj_close, volume
-            FROM price_history
-            WHERE ticker = %s
-            ORDER BY date DESC
-            LIMIT 1
-            """,
+            _SELECT_LATEST_PRICE_SQL,
             (ticker.upper(),),
         )
 
     async def has_data(self, ticker: str, days: int = 30) -> bool:
         """Check if we have recent price data for a ticker."""
         result = await self._pool.fetch_one(
-            """
-            SELECT COUNT(*) as count
-            FROM price_history
-            WHERE ticker = %s AND date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
-            """,
+            _COUNT_PRICES_SQL,
             (ticker.upper(), days),
         )
         return result and result.get("count", 0) > 0
@@ -534,13 +845,20 @@ class UniverseRepository:
     async def get_universe(self, name: str) -> dict[str, Any] | None:
         """Get a stock universe by name."""
         result = await self._pool.fetch_one(
-            "SELECT * FROM stock_universes WHERE name = %s",
+            _SELECT_UNIVERSE_SQL,
             (name.lower(),),
         )
         if result and result.get("tickers"):
-            result["tickers"] = json.loads(result["tickers"])
+            result["tickers"] = loads(result["tickers"])
         return result
 
+    async def get_universe_metadata(self, name: str) -> dict[str, Any] | None:
+        """Get universe metadata by name, without the tickers payload."""
+        return await self._pool.fetch_one(
+            _SELECT_UNIVERSE_META_SQL,
+            (name.lower(),),
+        )
+
     async def save_universe(
         self,
         name: str,
@@ -551,17 +869,11 @@ class UniverseRepository:
         """Save or update a stock universe. Returns universe_id."""
         tickers_upper = [t.upper() for t in tickers]
         _, uid = await self._pool.execute(
-            """
-            INSERT INTO stock_universes (name, description, tickers, source_url, ticker_count)
-            VALUES (%s, %s, %s, %s, %s) AS new_values
-            ON DUPLICATE KEY UPDATE
-            tickers = new_values.tickers, description = new_values.description,
-            source_url = new_values.source_url, ticker_count = new_values.ticker_count
-            """,
+            _UPSERT_UNIVERSE_SQL,
             (
                 name.lower(),
                 description,
-                json.dumps(tickers_upper),
+                dumps(tickers_upper),
                 source_url,
                 len(tickers_upper),
             ),
@@ -571,17 +883,13 @@ class UniverseRepository:
     async def list_universes(self) -> list[dict[str, Any]]:
         """List all available universes."""
         return await self._pool.fetch_all(
-            """
-            SELECT name, description, ticker_count, last_updated
-            FROM stock_universes
-            ORDER BY name
-            """
+            _SELECT_UNIVERSES_SQL
         )
 
     async def delete_universe(self, name: str) -> bool:
         """Delete a universe."""
         rows, _ = await self._pool.execute(
-            "DELETE FROM stock_universes WHERE name = %s",
+            _DELETE_UNIVERSE_SQL,
             (name.lower(),),
         )
         return rows > 0
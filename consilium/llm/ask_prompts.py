@@ -52,11 +52,50 @@ ASK_RESPONSE_SCHEMA = {
 }
 
 
+# Static prompt fragments, built once at import time
+_QA_SYSTEM_PROMPT_SUFFIX = """
+
+## Q&A Mode Instructions
+You are answering a direct question from an investor seeking your perspective.
+
+Guidelines:
+- Be conversational but substantive - this is a dialogue, not a formal report
+- Reference your investment philosophy and principles when relevant
+- If the question involves specific stocks, provide concrete analysis using the data
+- Be honest about uncertainties, limitations of your analysis, and areas outside your expertise
+- If the question asks about a strategy (e.g., long/short pairs), evaluate both sides
+- If asked about future projections, be clear about assumptions and timeframes
+- Maintain your character's voice and perspective throughout
+
+Remember: You are answering as this investor would, based on their known philosophy and track record.
+"""
+
+_QA_INSTRUCTIONS = (
+    "\n\n## Instructions\n\n"
+    "Please answer the question above from your perspective as an investor. "
+    "Draw on your investment philosophy and principles. "
+    "If the question involves specific stocks, use the market data provided to inform your response. "
+    "Be direct and substantive in your answer.\n"
+)
+
+_COMPARISON_INSTRUCTIONS = (
+    "\n\n## Instructions\n\n"
+    "Please compare the stocks mentioned and provide your recommendation. "
+    "Consider relative valuation, quality, and risk/reward for each. "
+    "State your preference and reasoning clearly.\n"
+)
+
+
+def _join_present(*items: str | None) -> str:
+    """Join the non-empty items with a pipe separator."""
+    return " | ".join(item for item in items if item)
+
+
 class AskPromptBuilder:
     """Builds prompts for Q&A interactions with investor agents."""
 
+    @staticmethod
     def build_qa_prompt(
-        self,
         question: str,
         stock_data: dict[str, Stock] | None = None,
     ) -> str:
@@ -70,134 +109,91 @@ class AskPromptBuilder:
         Returns:
             Formatted prompt string
         """
-        parts = []
-
-        # Add the question
-        parts.append("## Question from Investor\n")
-        parts.append(f'"{question}"\n')
+        prompt = f'## Question from Investor\n\n"{question}"\n'
 
         # Add stock data if available
         if stock_data:
-            parts.append("\n## Market Data for Referenced Stocks\n")
-            for ticker, stock in stock_data.items():
-                parts.append(self._format_stock_data(stock))
-                parts.append("\n")
+            prompt += "\n\n## Market Data for Referenced Stocks\n" + "".join(
+                f"\n{AskPromptBuilder._format_stock_data(stock)}\n\n"
+                for stock in stock_data.values()
+            )
 
         # Add response instructions
-        parts.append("\n## Instructions\n")
-        parts.append(
-            "Please answer the question above from your perspective as an investor. "
-            "Draw on your investment philosophy and principles. "
-            "If the question involves specific stocks, use the market data provided to inform your response. "
-            "Be direct and substantive in your answer.\n"
-        )
-
-        return "\n".join(parts)
+        return prompt + _QA_INSTRUCTIONS
 
-    def build_qa_system_prompt_suffix(self) -> str:
+    @staticmethod
+    def build_qa_system_prompt_suffix() -> str:
         """
         Return additional system prompt for Q&A mode.
 
         This is appended to the investor's standard system prompt.
         """
-        return """
+        return _QA_SYSTEM_PROMPT_SUFFIX
 
-## Q&A Mode Instructions
-You are answering a direct question from an investor seeking your perspective.
-
-Guidelines:
-- Be conversational but substantive - this is a dialogue, not a formal report
-- Reference your investment philosophy and principles when relevant
-- If the question involves specific stocks, provide concrete analysis using the data
-- Be honest about uncertainties, limitations of your analysis, and areas outside your expertise
-- If the question asks about a strategy (e.g., long/short pairs), evaluate both sides
-- If asked about future projections, be clear about assumptions and timeframes
-- Maintain your character's voice and perspective throughout
-
-Remember: You are answering as this investor would, based on their known philosophy and track record.
-"""
-
-    def _format_stock_data(self, stock: Stock) -> str:
+    @staticmethod
+    def _format_stock_data(stock: Stock) -> str:
         """Format stock data for inclusion in prompt."""
-        parts = []
+        company, price, f, t = stock.company, stock.price, stock.fundamentals, stock.technicals
 
         # Company info
-        company_name = stock.company.name if stock.company else stock.ticker
-        sector = stock.company.sector if stock.company else "N/A"
-        industry = stock.company.industry if stock.company else "N/A"
-
-        parts.append(f"### {stock.ticker} - {company_name}")
-        parts.append(f"**Sector:** {sector} | **Industry:** {industry}")
+        text = (
+            f"### {stock.ticker} - {company.name if company else stock.ticker}\n"
+            f"**Sector:** {company.sector if company else 'N/A'} | "
+            f"**Industry:** {company.industry if company else 'N/A'}"
+        )
 
         # Price data
-        if stock.price and stock.price.current:
-            parts.append(f"\n**Current Price:** ${stock.price.current:.2f}")
-            if stock.price.change_percent:
-                sign = "+" if stock.price.change_percent >= 0 else ""
-                parts.append(f" ({sign}{stock.price.change_percent:.2f}%)")
-
-        if stock.price and stock.price.fifty_two_week_high and stock.price.fifty_two_week_low:
-            parts.append(
-                f"\n**52-Week Range:** ${stock.price.fifty_two_week_low:.2f} - ${stock.price.fifty_two_week_high:.2f}"
+        if price and price.current:
+            text += f"\n\n**Current Price:** ${price.current:.2f}"
+            if price.change_percent:
+                sign = "+" if price.change_percent >= 0 else ""
+                text += f"\n ({sign}{price.change_percent:.2f}%)"
+
+        if price and price.fifty_two_week_high and price.fifty_two_week_low:
+            text += (
+                f"\n\n**52-Week Range:** "
+                f"${price.fifty_two_week_low:.2f} - ${price.fifty_two_week_high:.2f}"
+            )
+
+        if f:
+            # Key fundamentals
+            fundamentals = _join_present(
+                f"P/E: {f.pe_ratio:.1f}" if f.pe_ratio else None,
+                f"Fwd P/E: {f.forward_pe:.1f}" if f.forward_pe else None,
+                f"PEG: {f.peg_ratio:.2f}" if f.peg_ratio else None,
+                f"P/B: {f.price_to_book:.2f}" if f.price_to_book else None,
+                f"Market Cap: ${f.market_cap / 1_000_000_000:.1f}B" if f.market_cap else None,
             )
+            if fundamentals:
+                text += f"\n\n**Fundamentals:** {fundamentals}"
+
+            # Performance
+            performance = _join_present(
+                f"ROE: {f.roe:.1f}%" if f.roe else None,
+                f"Profit Margin: {f.profit_margin:.1f}%" if f.profit_margin else None,
+                f"Rev Growth: {f.revenue_growth:.1f}%" if f.revenue_growth else None,
+                f"Earnings Growth: {f.earnings_growth:.1f}%" if f.earnings_growth else None,
+            )
+            if performance:
+                text += f"\n\n**Performance:** {performance}"
 
-        # Key fundamentals
-        fundamentals_list = []
-        if stock.fundamentals:
-            f = stock.fundamentals
-            if f.pe_ratio:
-                fundamentals_list.append(f"P/E: {f.pe_ratio:.1f}")
-            if f.forward_pe:
-                fundamentals_list.append(f"Fwd P/E: {f.forward_pe:.1f}")
-            if f.peg_ratio:
-                fundamentals_list.append(f"PEG: {f.peg_ratio:.2f}")
-            if f.price_to_book:
-                fundamentals_list.append(f"P/B: {f.price_to_book:.2f}")
-            if f.market_cap:
-                cap_b = f.market_cap / 1_000_000_000
-                fundamentals_list.append(f"Market Cap: ${cap_b:.1f}B")
-
-        if fundamentals_list:
-            parts.append(f"\n**Fundamentals:** {' | '.join(fundamentals_list)}")
-
-        # Performance
-        performance = []
-        if stock.fundamentals:
-            f = stock.fundamentals
-            if f.roe:
-                performance.append(f"ROE: {f.roe:.1f}%")
-            if f.profit_margin:
-                performance.append(f"Profit Margin: {f.profit_margin:.1f}%")
-            if f.revenue_growth:
-                performance.append(f"Rev Growth: {f.revenue_growth:.1f}%")
-            if f.earnings_growth:
-                performance.append(f"Earnings Growth: {f.earnings_growth:.1f}%")
-
-        if performance:
-            parts.append(f"\n**Performance:** {' | '.join(performance)}")
-
-        # Dividend
-        if stock.fundamentals and stock.fundamentals.dividend_yield and stock.fundamentals.dividend_yield > 0:
-            parts.append(f"\n**Dividend Yield:** {stock.fundamentals.dividend_yield:.2f}%")
+            # Dividend
+            if f.dividend_yield and f.dividend_yield > 0:
+                text += f"\n\n**Dividend Yield:** {f.dividend_yield:.2f}%"
 
         # Technical indicators (brief)
-        technicals_list = []
-        if stock.technicals:
-            t = stock.technicals
-            if t.rsi_14:
-                technicals_list.append(f"RSI: {t.rsi_14:.0f}")
-            if t.trend:
-                technicals_list.append(f"Trend: {t.trend}")
-        if stock.fundamentals and stock.fundamentals.beta:
-            technicals_list.append(f"Beta: {stock.fundamentals.beta:.2f}")
-
-        if technicals_list:
-            parts.append(f"\n**Technicals:** {' | '.join(technicals_list)}")
+        technicals = _join_present(
+            f"RSI: {t.rsi_14:.0f}" if t and t.rsi_14 else None,
+            f"Trend: {t.trend}" if t and t.trend else None,
+            f"Beta: {f.beta:.2f}" if f and f.beta else None,
+        )
+        if technicals:
+            text += f"\n\n**Technicals:** {technicals}"
 
-        return "\n".join(parts)
+        return text
 
+    @staticmethod
     def build_comparison_prompt(
-        self,
         question: str,
         stock_data: dict[str, Stock] | None = None,
     ) -> str:
@@ -206,22 +202,12 @@ Remember: You are answering as this investor would, based on their known philoso
 
         Similar to qa_prompt but emphasizes comparison.
         """
-        parts = []
-
-        parts.append("## Comparison Question from Investor\n")
-        parts.append(f'"{question}"\n')
+        prompt = f'## Comparison Question from Investor\n\n"{question}"\n'
 
         if stock_data and len(stock_data) > 1:
-            parts.append("\n## Stocks to Compare\n")
-            for ticker, stock in stock_data.items():
-                parts.append(self._format_stock_data(stock))
-                parts.append("\n---\n")
-
-        parts.append("\n## Instructions\n")
-        parts.append(
-            "Please compare the stocks mentioned and provide your recommendation. "
-            "Consider relative valuation, quality, and risk/reward for each. "
-            "State your preference and reasoning clearly.\n"
-        )
+            prompt += "\n\n## Stocks to Compare\n" + "".join(
+                f"\n{AskPromptBuilder._format_stock_data(stock)}\n\n---\n"
+                for stock in stock_data.values()
+            )
 
-        return "\n".join(parts)
+        return prompt + _COMPARISON_INSTRUCTIONS
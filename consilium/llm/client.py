@@ -1,18 +1,62 @@
 """Async Anthropic Claude client wrapper with retry logic."""
 
 import json
+import re
 from typing import Any
 
-from anthropic import AsyncAnthropic
+from anthropic import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncAnthropic,
+)
 from tenacity import (
     retry,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+    wait_exponential_jitter,
 )
 
 from consilium.config import Settings, get_settings
 from consilium.core.exceptions import LLMError
+from consilium.core.serialization import loads
+
+# Captures the payload of a response, minus surrounding whitespace and an
+# optional ```json / ``` markdown fence
+_FENCE_RE = re.compile(r"\s*(?:```(?:json)?)?(.*?)(?:```)?\s*\Z", re.DOTALL)
+
+# HTTP statuses worth retrying besides 5xx (which includes 529 overloaded):
+# request timeout, conflict and rate limit. Anything else (bad request, auth)
+# fails the same way on every attempt.
+_RETRYABLE_STATUS = frozenset({408, 409, 429})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Return True for API failures that may succeed on retry."""
+    # APIConnectionError also covers timeouts
+    if isinstance(exc, APIConnectionError):
+        return True
+    return isinstance(exc, APIStatusError) and (
+        exc.status_code in _RETRYABLE_STATUS or exc.status_code >= 500
+    )
+
+
+# Rendered schema instructions keyed by schema identity. The schema itself is
+# kept alongside so its id cannot be reused while the entry exists.
+_SCHEMA_INSTRUCTIONS: dict[int, tuple[dict[str, Any], str]] = {}
+
+
+def _schema_instruction(schema: dict[str, Any]) -> str:
+    """Return the JSON-output instruction for a schema, rendering it once."""
+    entry = _SCHEMA_INSTRUCTIONS.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = (
+            schema,
+            "\n\nYou MUST respond with a valid JSON object matching this schema:\n"
+            f"```json\n{json.dumps(schema, separators=(',', ':'))}\n```\n"
+            "Respond ONLY with the JSON object, no additional text.",
+        )
+        _SCHEMA_INSTRUCTIONS[id(schema)] = entry
+    return entry[1]
 
 
 class ClaudeClient:
@@ -21,6 +65,9 @@ class ClaudeClient:
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or get_settings()
         self._client = AsyncAnthropic(api_key=self._settings.anthropic_api_key)
+        # _complete_raw() retries with tenacity, so its calls skip the SDK's own
+        # retries; a failing call would otherwise be retried up to 3x3 times.
+        self._create = self._client.with_options(max_retries=0).messages.create
         self._model = self._settings.model
 
     @property
@@ -28,12 +75,6 @@ class ClaudeClient:
         """Get the current model name."""
         return self._model
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((Exception,)),
-        reraise=True,
-    )
     async def complete(
         self,
         system_prompt: str,
@@ -55,63 +96,59 @@ class ClaudeClient:
         Returns:
             Parsed JSON response as dict
         """
-        try:
-            # Build messages
-            messages = [{"role": "user", "content": user_prompt}]
-
-            # If schema provided, add instructions for JSON output
-            if response_schema:
-                schema_instruction = (
-                    "\n\nYou MUST respond with a valid JSON object matching this schema:\n"
-                    f"```json\n{json.dumps(response_schema, indent=2)}\n```\n"
-                    "Respond ONLY with the JSON object, no additional text."
-                )
-                full_system = system_prompt + schema_instruction
-            else:
-                full_system = system_prompt
+        # If schema provided, add instructions for JSON output
+        if response_schema:
+            full_system = system_prompt + _schema_instruction(response_schema)
+        else:
+            full_system = system_prompt
 
-            response = await self._client.messages.create(
+        try:
+            content = await self._complete_raw(full_system, user_prompt, max_tokens, temperature)
+        except Exception as e:
+            raise LLMError(
+                f"Claude API error: {e}",
                 model=self._model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=full_system,
-                messages=messages,
-            )
-
-            # Extract text content
-            content = response.content[0].text
+            ) from e
 
-            # Parse JSON response
+        # Parsed outside the retry scope: a malformed response is not re-billed
+        try:
             return self._parse_json_response(content)
-
         except json.JSONDecodeError as e:
             raise LLMError(
                 f"Failed to parse JSON response: {e}",
                 model=self._model,
-                details={"raw_response": content[:500] if "content" in dir() else None},
-            ) from e
-        except Exception as e:
-            raise LLMError(
-                f"Claude API error: {e}",
-                model=self._model,
+                details={"raw_response": content[:500]},
             ) from e
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=1, max=10),
+        retry=retry_if_exception(_is_transient),
+        reraise=True,
+    )
+    async def _complete_raw(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> str:
+        """Send a completion request, retrying transient API errors, and return its text."""
+        response = await self._create(
+            model=self._model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+        )
+        return response.content[0].text
+
     def _parse_json_response(self, content: str) -> dict[str, Any]:
         """Parse JSON from response, handling markdown code blocks."""
-        content = content.strip()
-
-        # Remove markdown code blocks if present
-        if content.startswith("```json"):
-            content = content[7:]
-        elif content.startswith("```"):
-            content = content[3:]
-
-        if content.endswith("```"):
-            content = content[:-3]
-
-        content = content.strip()
-
-        return json.loads(content)
+        match = _FENCE_RE.match(content)
+        # Every group in the pattern is optional or lazy, so it matches any string
+        assert match is not None
+        return loads(match.group(1))
 
     async def complete_text(
         self,
@@ -121,7 +158,7 @@ class ClaudeClient:
         temperature: float = 0.7,
     ) -> str:
         """
-        Send a completion request and return raw text response.
+        Stream a completion request and return the raw text response.
 
         Args:
             system_prompt: The system prompt
@@ -133,15 +170,18 @@ class ClaudeClient:
             Raw text response
         """
         try:
-            response = await self._client.messages.create(
+            chunks: list[str] = []
+            async with self._client.messages.stream(
                 model=self._model,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 system=system_prompt,
                 messages=[{"role": "user", "content": user_prompt}],
-            )
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
 
-            return response.content[0].text
+            return "".join(chunks)
 
         except Exception as e:
             raise LLMError(
@@ -161,75 +201,3 @@ class ClaudeClient:
         except Exception:
             return False
 
-
-# Response schemas for structured output
-
-AGENT_RESPONSE_SCHEMA = {
-    "type": "object",
-    "properties": {
-        "signal": {
-            "type": "string",
-            "enum": ["STRONG_BUY", "BUY", "HOLD", "SELL", "STRONG_SELL"],
-            "description": "Investment recommendation signal",
-        },
-        "confidence": {
-            "type": "string",
-            "enum": ["VERY_HIGH", "HIGH", "MEDIUM", "LOW", "VERY_LOW"],
-            "description": "Confidence level in the analysis",
-        },
-        "target_price": {
-            "type": "number",
-            "minimum": 0,
-            "description": "Estimated fair value / target price (optional)",
-        },
-        "reasoning": {
-            "type": "string",
-            "minLength": 100,
-            "description": "Detailed reasoning for the recommendation (2-3 paragraphs)",
-        },
-        "key_factors": {
-            "type": "array",
-            "items": {"type": "string"},
-            "minItems": 3,
-            "maxItems": 5,
-            "description": "Key factors driving the recommendation",
-        },
-        "risks": {
-            "type": "array",
-            "items": {"type": "string"},
-            "minItems": 2,
-            "maxItems": 4,
-            "description": "Primary risks identified",
-        },
-        "time_horizon": {
-            "type": "string",
-            "description": "Recommended time horizon (e.g., '6-12 months')",
-        },
-    },
-    "required": ["signal", "confidence", "reasoning", "key_factors", "risks"],
-}
-
-SPECIALIST_REPORT_SCHEMA = {
-    "type": "object",
-    "properties": {
-        "summary": {
-            "type": "string",
-            "description": "One paragraph executive summary",
-        },
-        "analysis": {
-            "type": "string",
-            "description": "Detailed analysis (2-3 paragraphs)",
-        },
-        "score": {
-            "type": "number",
-            "minimum": 0,
-            "maximum": 100,
-            "description": "Overall score from 0-100",
-        },
-        "metrics": {
-            "type": "object",
-            "description": "Key metrics and their values/assessments",
-        },
-    },
-    "required": ["summary", "analysis", "score"],
-}
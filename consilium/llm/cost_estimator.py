@@ -2,9 +2,12 @@
 
 from dataclasses import dataclass, field
 from decimal import Decimal
+from functools import cache
 
+_PICO_USD_PER_USD = Decimal(10**12)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ModelPricing:
     """Pricing per million tokens (USD)."""
 
@@ -12,7 +15,7 @@ class ModelPricing:
     output_per_mtok: Decimal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostBreakdown:
     """Breakdown of estimated costs."""
 
@@ -23,7 +26,7 @@ class CostBreakdown:
     cost_usd: Decimal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostEstimate:
     """Complete cost estimate for an analysis."""
 
@@ -86,6 +89,14 @@ class CostEstimator:
     def __init__(self, model: str = "claude-opus-4-5-20251101") -> None:
         self.model = model
         self.pricing = self.PRICING.get(model, self.PRICING["claude-opus-4-5-20251101"])
+        # Prices in integer micro-USD per million tokens for _calculate_cost
+        self._input_micro = int(self.pricing.input_per_mtok * 1_000_000)
+        self._output_micro = int(self.pricing.output_per_mtok * 1_000_000)
+        # Cost of one call of each estimated type, in integer pico-USD
+        self._pico_per_call = {
+            key: tokens["input"] * self._input_micro + tokens["output"] * self._output_micro
+            for key, tokens in self.TOKEN_ESTIMATES.items()
+        }
 
     def estimate(
         self,
@@ -111,46 +122,19 @@ class CostEstimator:
         if num_specialists is None:
             num_specialists = self.DEFAULT_SPECIALISTS
 
-        breakdowns: list[CostBreakdown] = []
-
-        # Specialist costs (if enabled)
+        # (component, TOKEN_ESTIMATES key, API calls) per agent group
+        components: list[tuple[str, str, int]] = []
         if include_specialists and num_specialists > 0:
-            specialist_calls = num_tickers * num_specialists
-            specialist_input = specialist_calls * self.TOKEN_ESTIMATES["specialist"]["input"]
-            specialist_output = specialist_calls * self.TOKEN_ESTIMATES["specialist"]["output"]
-            specialist_cost = self._calculate_cost(specialist_input, specialist_output)
-
-            breakdowns.append(
-                CostBreakdown(
-                    component="Specialists",
-                    api_calls=specialist_calls,
-                    input_tokens=specialist_input,
-                    output_tokens=specialist_output,
-                    cost_usd=specialist_cost,
-                )
-            )
-
-        # Investor costs
-        investor_calls = num_tickers * num_investors
-
-        # Choose token estimate based on whether specialists are included
-        token_key = "investor" if include_specialists else "investor_no_specialists"
-        investor_input_per_call = self.TOKEN_ESTIMATES[token_key]["input"]
-        investor_output_per_call = self.TOKEN_ESTIMATES[token_key]["output"]
-
-        investor_input = investor_calls * investor_input_per_call
-        investor_output = investor_calls * investor_output_per_call
-        investor_cost = self._calculate_cost(investor_input, investor_output)
-
-        breakdowns.append(
-            CostBreakdown(
-                component="Investors",
-                api_calls=investor_calls,
-                input_tokens=investor_input,
-                output_tokens=investor_output,
-                cost_usd=investor_cost,
-            )
-        )
+            components.append(("Specialists", "specialist", num_tickers * num_specialists))
+
+        # Investors see specialist reports in their prompt when specialists run
+        investor_key = "investor" if include_specialists else "investor_no_specialists"
+        components.append(("Investors", investor_key, num_tickers * num_investors))
+
+        breakdowns = [
+            self._breakdown(component, token_key, calls)
+            for component, token_key, calls in components
+        ]
 
         # Calculate totals
         total_calls = sum(b.api_calls for b in breakdowns)
@@ -170,9 +154,28 @@ class CostEstimator:
 
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> Decimal:
         """Calculate cost from token counts."""
-        input_cost = (Decimal(input_tokens) / Decimal("1000000")) * self.pricing.input_per_mtok
-        output_cost = (Decimal(output_tokens) / Decimal("1000000")) * self.pricing.output_per_mtok
-        return input_cost + output_cost
+        # tokens * micro-USD per million tokens is an exact count of pico-USD
+        return self._to_usd(input_tokens * self._input_micro + output_tokens * self._output_micro)
+
+    def _breakdown(self, component: str, token_key: str, calls: int) -> CostBreakdown:
+        """Build the cost breakdown for a number of calls of one TOKEN_ESTIMATES type."""
+        tokens = self.TOKEN_ESTIMATES[token_key]
+        return CostBreakdown(
+            component=component,
+            api_calls=calls,
+            input_tokens=calls * tokens["input"],
+            output_tokens=calls * tokens["output"],
+            cost_usd=self._calls_cost(token_key, calls),
+        )
+
+    def _calls_cost(self, token_key: str, calls: int) -> Decimal:
+        """Calculate cost of a number of calls of one TOKEN_ESTIMATES type."""
+        return self._to_usd(calls * self._pico_per_call[token_key])
+
+    @staticmethod
+    def _to_usd(pico_usd: int) -> Decimal:
+        """Convert a pico-USD amount to USD."""
+        return Decimal(pico_usd) / _PICO_USD_PER_USD
 
     def estimate_ask(
         self,
@@ -191,31 +194,16 @@ class CostEstimator:
         """
         # Choose token estimate based on market data inclusion
         token_key = "ask_with_data" if include_market_data else "ask_no_data"
-        input_per_call = self.TOKEN_ESTIMATES[token_key]["input"]
-        output_per_call = self.TOKEN_ESTIMATES[token_key]["output"]
-
-        total_input = num_agents * input_per_call
-        total_output = num_agents * output_per_call
-        total_cost = self._calculate_cost(total_input, total_output)
-
-        breakdowns = [
-            CostBreakdown(
-                component="Q&A Responses",
-                api_calls=num_agents,
-                input_tokens=total_input,
-                output_tokens=total_output,
-                cost_usd=total_cost,
-            )
-        ]
+        breakdown = self._breakdown("Q&A Responses", token_key, num_agents)
 
         return CostEstimate(
             model=self.model,
             tickers=[],
-            breakdowns=breakdowns,
+            breakdowns=[breakdown],
             total_api_calls=num_agents,
-            total_input_tokens=total_input,
-            total_output_tokens=total_output,
-            total_cost_usd=total_cost,
+            total_input_tokens=breakdown.input_tokens,
+            total_output_tokens=breakdown.output_tokens,
+            total_cost_usd=breakdown.cost_usd,
         )
 
     @classmethod
@@ -227,3 +215,9 @@ class CostEstimator:
             "claude-3-5-haiku-20241022": "Claude 3.5 Haiku",
         }
         return names.get(model_id, model_id)
+
+
+@cache
+def get_cost_estimator(model: str) -> CostEstimator:
+    """Get a shared CostEstimator for a model."""
+    return CostEstimator(model)
@@ -1,21 +1,116 @@
 """Prompt templates and YAML loader for agent personalities."""
 
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
-from jinja2 import Environment, BaseLoader
 
 from consilium.config import get_settings
 from consilium.core.models import Stock, SpecialistReport
 
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Lowercase sector keywords that flag high political exposure
+_HIGH_POLITICAL_EXPOSURE_SECTORS = frozenset({
+    "energy", "utilities", "financial", "telecommunications",
+    "defense", "healthcare", "transportation", "mining",
+})
+
+# Static tails of the agent system prompts
+_INVESTOR_SYSTEM_TAIL = """
+
+## Analysis Framework
+When analyzing a stock, you must:
+1. Evaluate against your core principles
+2. Consider the specialist analyses provided (if any)
+3. Apply your unique perspective and experience
+4. Provide clear reasoning for your recommendation
+5. Be specific about metrics and numbers
+6. Acknowledge uncertainty when data is limited
+7. Consider both bull and bear cases
+
+## Output Requirements
+You must respond with a valid JSON object containing:
+- signal: One of "STRONG_BUY", "BUY", "HOLD", "SELL", "STRONG_SELL"
+- confidence: One of "VERY_HIGH", "HIGH", "MEDIUM", "LOW", "VERY_LOW"
+- target_price: Your estimated fair value (number, optional)
+- reasoning: 2-3 paragraphs explaining your analysis (string)
+- key_factors: Array of 3-5 key factors driving your decision
+- risks: Array of 2-4 primary risks you see
+- time_horizon: Your recommended holding period (e.g., "12-24 months")
+
+Respond ONLY with the JSON object, no additional text or markdown.
+"""
+
+_SPECIALIST_SYSTEM_TAIL = """
+
+## Output Requirements
+You must respond with a valid JSON object containing:
+- summary: One paragraph executive summary of your analysis
+- analysis: Detailed analysis (2-3 paragraphs)
+- score: Overall score from 0-100 based on your criteria
+- metrics: Object with key metrics and their values/assessments
+
+Respond ONLY with the JSON object, no additional text or markdown.
+"""
+
+
+def _format_number(value: Any, template: str, scale: int) -> str:
+    """Format a numeric value with a str.format template, or "N/A" if not numeric."""
+    if value is None:
+        return "N/A"
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return "N/A"
+    return _format_float(number * scale, template)
+
+
+@lru_cache(maxsize=4096)
+def _format_float(value: float, template: str) -> str:
+    """Format a float with a str.format template.
+
+    Cached because the same fundamentals are formatted into the investor
+    prompt and several specialist prompts for every stock. Values are
+    coerced to float first so unhashable inputs never reach the cache.
+    """
+    return template.format(value)
+
+
+@lru_cache(maxsize=1)
+def _jinja_env() -> "Environment":
+    """Get the Jinja environment shared by every PromptBuilder.
+
+    jinja2 is imported on first use; none of the current prompts are templates.
+    """
+    from jinja2 import BaseLoader, Environment
+
+    return Environment(loader=BaseLoader(), auto_reload=False)
+
 
 class PromptLoader:
-    """Loader for YAML-based agent prompts."""
+    """Loader for YAML-based agent prompts.
+
+    Parsed prompts are cached per file and revalidated against the file's
+    mtime and size, so edits are picked up without a restart.
+    """
+
+    CACHE_SIZE = 100
 
     def __init__(self, prompts_dir: Path | None = None) -> None:
         self._prompts_dir = prompts_dir or get_settings().prompts_dir
-        self._cache: dict[str, dict[str, Any]] = {}
+        self._cache: OrderedDict[str, tuple[float, int, dict[str, Any]]] = OrderedDict()
+        self._listings: dict[str, tuple[float, list[str]]] = {}
 
     def load_investor_prompt(self, agent_id: str) -> dict[str, Any]:
         """Load investor agent prompt from YAML."""
@@ -25,37 +120,124 @@ class PromptLoader:
         """Load specialist agent prompt from YAML."""
         return self._load_prompt("specialists", agent_id)
 
+    def preload(self, categories: tuple[str, ...] = ("investors", "specialists")) -> None:
+        """Parse every prompt in the given categories in parallel and cache it.
+
+        Files that fail to load are skipped here; _load_prompt reports the
+        error when that prompt is actually requested.
+        """
+        pending = [
+            (f"{category}/{agent_id}", self._prompts_dir / category / f"{agent_id}.yaml")
+            for category in categories
+            for agent_id in self.list_available(category)
+        ]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            futures = [
+                (cache_key, executor.submit(self._read_prompt, file_path))
+                for cache_key, file_path in pending
+            ]
+        for cache_key, future in futures:
+            if future.exception() is None:
+                self._store(cache_key, future.result())
+
     def _load_prompt(self, category: str, agent_id: str) -> dict[str, Any]:
         """Load and cache prompt from YAML file."""
         cache_key = f"{category}/{agent_id}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
         file_path = self._prompts_dir / category / f"{agent_id}.yaml"
-        if not file_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {file_path}")
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            prompt_data = yaml.safe_load(f)
-
-        self._cache[cache_key] = prompt_data
-        return prompt_data
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            self._cache.pop(cache_key, None)
+            raise FileNotFoundError(f"Prompt file not found: {file_path}") from None
+
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            self._cache.move_to_end(cache_key)
+            return cached[2]
+
+        entry = self._read_prompt(file_path)
+        self._store(cache_key, entry)
+        return entry[2]
+
+    @staticmethod
+    def _read_prompt(file_path: Path) -> tuple[float, int, dict[str, Any]]:
+        """Stat and parse a prompt file."""
+        st = file_path.stat()
+        prompt_data = yaml.load(file_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
+        return st.st_mtime, st.st_size, prompt_data
+
+    def _store(self, cache_key: str, entry: tuple[float, int, dict[str, Any]]) -> None:
+        """Cache a parsed prompt, evicting the least recently used if full."""
+        self._cache[cache_key] = entry
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
 
     def list_available(self, category: str) -> list[str]:
         """List available prompts in a category."""
         category_dir = self._prompts_dir / category
-        if not category_dir.exists():
+        try:
+            mtime = category_dir.stat().st_mtime
+        except FileNotFoundError:
             return []
 
-        return [f.stem for f in category_dir.glob("*.yaml")]
+        cached = self._listings.get(category)
+        if cached is None or cached[0] != mtime:
+            with os.scandir(category_dir) as entries:
+                names = [
+                    e.name[:-5] for e in entries if e.name.endswith(".yaml") and e.is_file()
+                ]
+            cached = self._listings[category] = (mtime, names)
+        return list(cached[1])
+
+
+# Stock snapshot (ticker, fetched_at, current price) plus one
+# (specialist_id, generated_at, score) entry per specialist report
+_AnalysisPromptKey = tuple[
+    str, datetime, Decimal, tuple[tuple[str, datetime, Decimal | None], ...] | None
+]
+
+
+def _analysis_prompt_key(
+    stock: Stock, specialist_reports: list[SpecialistReport] | None
+) -> _AnalysisPromptKey:
+    """Key an investor analysis prompt on the content it is rendered from."""
+    reports = None
+    if specialist_reports is not None:
+        reports = tuple(
+            (report.specialist_id, report.generated_at, report.score)
+            for report in specialist_reports
+        )
+    return (stock.ticker, stock.fetched_at, stock.price.current, reports)
 
 
 class PromptBuilder:
     """Builder for constructing prompts from templates."""
 
+    ANALYSIS_PROMPT_CACHE_SIZE = 32
+
+    # Specialist focus area -> prompt builder method
+    _FOCUS_PROMPT_BUILDERS: dict[str, str] = {
+        "valuation": "_build_valuation_prompt",
+        "fundamentals": "_build_fundamentals_prompt",
+        "technicals": "_build_technicals_prompt",
+        "sentiment": "_build_sentiment_prompt",
+        "risk": "_build_risk_prompt",
+        "portfolio": "_build_portfolio_prompt",
+        "political": "_build_political_prompt",
+    }
+
     def __init__(self, loader: PromptLoader | None = None) -> None:
         self._loader = loader or PromptLoader()
-        self._jinja = Environment(loader=BaseLoader())
+        self._analysis_prompts: OrderedDict[_AnalysisPromptKey, str] = OrderedDict()
+
+    @property
+    def _jinja(self) -> "Environment":
+        """Shared Jinja environment, created on first access."""
+        return _jinja_env()
 
     def build_system_prompt(
         self,
@@ -67,36 +249,10 @@ class PromptBuilder:
         """Build system prompt for an investor agent."""
         principles_text = "\n".join(f"- {p}" for p in principles)
 
-        return f"""{persona}
-
-## Your Investment Philosophy
-{philosophy}
-
-## Key Principles You Apply
-{principles_text}
-
-## Analysis Framework
-When analyzing a stock, you must:
-1. Evaluate against your core principles
-2. Consider the specialist analyses provided (if any)
-3. Apply your unique perspective and experience
-4. Provide clear reasoning for your recommendation
-5. Be specific about metrics and numbers
-6. Acknowledge uncertainty when data is limited
-7. Consider both bull and bear cases
-
-## Output Requirements
-You must respond with a valid JSON object containing:
-- signal: One of "STRONG_BUY", "BUY", "HOLD", "SELL", "STRONG_SELL"
-- confidence: One of "VERY_HIGH", "HIGH", "MEDIUM", "LOW", "VERY_LOW"
-- target_price: Your estimated fair value (number, optional)
-- reasoning: 2-3 paragraphs explaining your analysis (string)
-- key_factors: Array of 3-5 key factors driving your decision
-- risks: Array of 2-4 primary risks you see
-- time_horizon: Your recommended holding period (e.g., "12-24 months")
-
-Respond ONLY with the JSON object, no additional text or markdown.
-"""
+        return (
+            f"{persona}\n\n## Your Investment Philosophy\n{philosophy}"
+            f"\n\n## Key Principles You Apply\n{principles_text}{_INVESTOR_SYSTEM_TAIL}"
+        )
 
     def build_specialist_system_prompt(
         self,
@@ -105,28 +261,40 @@ Respond ONLY with the JSON object, no additional text or markdown.
         methodology: str,
     ) -> str:
         """Build system prompt for a specialist agent."""
-        return f"""You are the {name}, a quantitative specialist focused on {focus}.
-
-## Your Methodology
-{methodology}
-
-## Output Requirements
-You must respond with a valid JSON object containing:
-- summary: One paragraph executive summary of your analysis
-- analysis: Detailed analysis (2-3 paragraphs)
-- score: Overall score from 0-100 based on your criteria
-- metrics: Object with key metrics and their values/assessments
-
-Respond ONLY with the JSON object, no additional text or markdown.
-"""
+        return (
+            f"You are the {name}, a quantitative specialist focused on {focus}."
+            f"\n\n## Your Methodology\n{methodology}{_SPECIALIST_SYSTEM_TAIL}"
+        )
 
     def build_investor_analysis_prompt(
         self,
         stock: Stock,
         specialist_reports: list[SpecialistReport] | None = None,
     ) -> str:
-        """Build analysis prompt for an investor agent."""
-        from datetime import date as date_type, datetime
+        """Build analysis prompt for an investor agent.
+
+        The prompt does not depend on the investor, so it is cached per stock
+        snapshot and set of specialist reports shared by every investor on a ticker.
+        """
+        key = _analysis_prompt_key(stock, specialist_reports)
+        cached = self._analysis_prompts.get(key)
+        if cached is not None:
+            self._analysis_prompts.move_to_end(key)
+            return cached
+
+        prompt = self._render_investor_analysis_prompt(stock, specialist_reports)
+        self._analysis_prompts[key] = prompt
+        if len(self._analysis_prompts) > self.ANALYSIS_PROMPT_CACHE_SIZE:
+            self._analysis_prompts.popitem(last=False)
+        return prompt
+
+    def _render_investor_analysis_prompt(
+        self,
+        stock: Stock,
+        specialist_reports: list[SpecialistReport] | None,
+    ) -> str:
+        """Render the investor analysis prompt text."""
+        from datetime import date as date_type
 
         # Check if this is historical/retroactive analysis
         analysis_date = stock.fetched_at.date() if stock.fetched_at else date_type.today()
@@ -143,7 +311,7 @@ Note: Fundamental metrics may reflect more recent data due to data source limita
 
 """
 
-        prompt = f"""## Stock Under Analysis: {stock.ticker}
+        parts = [f"""## Stock Under Analysis: {stock.ticker}
 {date_header}
 ### Company Overview
 Name: {stock.company.name}
@@ -185,26 +353,23 @@ SMA 200: ${stock.technicals.sma_200 or 'N/A'}
 RSI (14): {stock.technicals.rsi_14 or 'N/A'}
 MACD: {stock.technicals.macd or 'N/A'}
 Trend: {stock.technicals.trend or 'N/A'}
-"""
+"""]
 
         if specialist_reports:
-            prompt += "\n### Specialist Analysis Reports\n"
-            for report in specialist_reports:
-                prompt += f"""
-#### {report.specialist_name}
-Score: {report.score}/100
-Summary: {report.summary}
-
-Analysis: {report.analysis}
-"""
+            parts.append("\n### Specialist Analysis Reports\n")
+            parts.extend(
+                f"\n#### {report.specialist_name}\nScore: {report.score}/100\n"
+                f"Summary: {report.summary}\n\nAnalysis: {report.analysis}\n"
+                for report in specialist_reports
+            )
 
-        prompt += f"""
+        parts.append(f"""
 
 ---
 
 Based on the above information and your investment philosophy, provide your analysis and recommendation for {stock.ticker}.
-"""
-        return prompt
+""")
+        return "".join(parts)
 
     def build_specialist_analysis_prompt(
         self,
@@ -212,22 +377,10 @@ Based on the above information and your investment philosophy, provide your anal
         focus_area: str,
     ) -> str:
         """Build analysis prompt for a specialist agent."""
-        if focus_area == "valuation":
-            return self._build_valuation_prompt(stock)
-        elif focus_area == "fundamentals":
-            return self._build_fundamentals_prompt(stock)
-        elif focus_area == "technicals":
-            return self._build_technicals_prompt(stock)
-        elif focus_area == "sentiment":
-            return self._build_sentiment_prompt(stock)
-        elif focus_area == "risk":
-            return self._build_risk_prompt(stock)
-        elif focus_area == "portfolio":
-            return self._build_portfolio_prompt(stock)
-        elif focus_area == "political":
-            return self._build_political_prompt(stock)
-        else:
+        builder = self._FOCUS_PROMPT_BUILDERS.get(focus_area)
+        if builder is None:
             raise ValueError(f"Unknown focus area: {focus_area}")
+        return getattr(self, builder)(stock)
 
     def _build_valuation_prompt(self, stock: Stock) -> str:
         """Build valuation-focused analysis prompt."""
@@ -424,14 +577,8 @@ As Portfolio Manager, synthesize:
         industry = stock.company.industry or "Unknown"
 
         # Sectors with high political exposure
-        high_political_sectors = [
-            "energy", "utilities", "financial", "telecommunications",
-            "defense", "healthcare", "transportation", "mining"
-        ]
-        is_high_exposure = any(
-            s.lower() in (sector.lower() + " " + industry.lower())
-            for s in high_political_sectors
-        )
+        sector_text = f"{sector} {industry}".lower()
+        is_high_exposure = any(s in sector_text for s in _HIGH_POLITICAL_EXPOSURE_SECTORS)
 
         exposure_note = ""
         if is_high_exposure:
@@ -508,27 +655,12 @@ Provide:
 
     def _format_pct(self, value: Any) -> str:
         """Format a value as percentage."""
-        if value is None:
-            return "N/A"
-        try:
-            return f"{float(value) * 100:.1f}%"
-        except (ValueError, TypeError):
-            return "N/A"
+        return _format_number(value, "{:.1f}%", 100)
 
     def _format_market_cap(self, value: Any) -> str:
         """Format market cap with $ and commas."""
-        if value is None:
-            return "N/A"
-        try:
-            return f"${float(value):,.0f}"
-        except (ValueError, TypeError):
-            return "N/A"
+        return _format_number(value, "${:,.0f}", 1)
 
     def _format_currency(self, value: Any) -> str:
         """Format a currency value."""
-        if value is None:
-            return "N/A"
-        try:
-            return f"${float(value):,.0f}"
-        except (ValueError, TypeError):
-            return "N/A"
+        return _format_number(value, "${:,.0f}", 1)
@@ -1,14 +1,20 @@
 """Rich formatters for Q&A output."""
 
 from decimal import Decimal
+from typing import Final
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
 from consilium.ask.models import AskResult, AskResponse
 from consilium.core.enums import SignalType, ConfidenceLevel
+from consilium.output.console import default_console, format_date
+
+_HR60_MARKUP = f"[dim]{'─' * 60}[/dim]"
+_HR20_DIM = "─" * 20
+_ZERO: Final[Decimal] = Decimal("0")
 
 
 class AskFormatter:
@@ -30,8 +36,23 @@ class AskFormatter:
         ConfidenceLevel.VERY_LOW: "bold red",
     }
 
+    # Pre-rendered "[color]VALUE[/color]" markup, built once at import time
+    SIGNAL_MARKUP: dict[SignalType, str] = {
+        signal: f"[{color}]{signal.value}[/{color}]"
+        for signal, color in SIGNAL_COLORS.items()
+    }
+
+    CONFIDENCE_MARKUP: dict[ConfidenceLevel, str] = {
+        level: f"[{color}]{level.value}[/{color}]"
+        for level, color in CONFIDENCE_COLORS.items()
+    }
+
+    # History table truncation limits (characters before the "..." suffix)
+    QUESTION_LIMIT = 47
+    TICKERS_LIMIT = 12
+
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or default_console()
 
     def display_single_response(self, result: AskResult) -> None:
         """Display a single investor response in detail."""
@@ -39,9 +60,10 @@ class AskFormatter:
             self.console.print("[yellow]No responses received.[/yellow]")
             return
 
-        response = result.responses[0]
-        self._display_response_panel(result, response)
-        self._display_cost_footer(result)
+        self.console.print(Group(
+            self._render_response_panel(result, result.responses[0]),
+            self._render_cost_footer(result),
+        ))
 
     def display_comparison(self, result: AskResult) -> None:
         """Display comparison of multiple investor responses."""
@@ -49,21 +71,12 @@ class AskFormatter:
             self.console.print("[yellow]No responses received.[/yellow]")
             return
 
-        # Header with question info
-        self._display_header(result)
-
-        # Summary table
-        self._display_summary_table(result)
-
-        # Consensus
-        self._display_consensus(result)
-
-        # Individual responses
-        self.console.print()
-        for response in result.responses:
-            self._display_response_section(response)
-
-        self._display_cost_footer(result)
+        self.console.print(Group(
+            # Header with question info
+            self._render_header(result),
+            *self._render_multi_response_body(result),
+            self._render_cost_footer(result),
+        ))
 
     def display_history(
         self,
@@ -83,51 +96,65 @@ class AskFormatter:
         table.add_column("Agents", width=10, justify="center")
         table.add_column("Cost", justify="right", width=8)
 
-        for q in questions:
-            question_text = q["question"]
-            if len(question_text) > 47:
-                question_text = question_text[:47] + "..."
-
-            tickers = ", ".join(q.get("tickers", [])) or "-"
-            if len(tickers) > 12:
-                tickers = tickers[:12] + "..."
-
-            agents_count = len(q.get("agents", []))
-            date_str = q["created_at"].strftime("%Y-%m-%d") if q.get("created_at") else "-"
-            cost = f"${q.get('cost_usd', Decimal('0')):.2f}"
-
-            table.add_row(
-                str(q["id"]),
-                date_str,
-                question_text,
-                tickers,
-                str(agents_count),
-                cost,
-            )
+        for row in [self._history_row(q) for q in questions]:
+            table.add_row(*row)
 
         self.console.print(table)
 
     def display_question_detail(self, result: AskResult) -> None:
         """Display detailed view of a single question with all responses."""
-        # Header
-        self._display_header(result)
+        renderables: list[RenderableType] = [self._render_header(result)]
 
         if len(result.responses) == 1:
-            self._display_response_panel(result, result.responses[0])
+            renderables.append(self._render_response_panel(result, result.responses[0]))
         else:
-            # Summary table
-            self._display_summary_table(result)
-            self._display_consensus(result)
+            renderables.extend(self._render_multi_response_body(result))
+
+        renderables.append(self._render_cost_footer(result))
+        self.console.print(Group(*renderables))
+
+    @staticmethod
+    def _history_row(q: dict) -> tuple[str, str, str, str, str, str]:
+        """Format one history entry as a table row."""
+        question_text = q["question"]
+        if len(question_text) > AskFormatter.QUESTION_LIMIT:
+            question_text = f"{question_text[:AskFormatter.QUESTION_LIMIT]}..."
+
+        tickers = "-"
+        tickers_list = q.get("tickers")
+        if tickers_list:
+            tickers = ", ".join(tickers_list)
+            if len(tickers) > AskFormatter.TICKERS_LIMIT:
+                tickers = f"{tickers[:AskFormatter.TICKERS_LIMIT]}..."
+
+        agents = q.get("agents")
+
+        created_at = q.get("created_at")
+        return (
+            str(q["id"]),
+            format_date(created_at) if created_at else "-",
+            question_text,
+            tickers,
+            str(len(agents)) if agents else "0",
+            f"${q.get('cost_usd', _ZERO):.2f}",
+        )
 
-            # Individual responses
-            self.console.print()
-            for response in result.responses:
-                self._display_response_section(response)
+    def _render_multi_response_body(self, result: AskResult) -> list[RenderableType]:
+        """Render summary table, consensus and per-response sections."""
+        # Summary table and consensus
+        renderables: list[RenderableType] = [self._render_summary_table(result)]
+        consensus = self._render_consensus(result)
+        if consensus is not None:
+            renderables.append(consensus)
 
-        self._display_cost_footer(result)
+        # Individual responses
+        renderables.append("")
+        for response in result.responses:
+            renderables.extend(self._render_response_section(response))
+        return renderables
 
-    def _display_header(self, result: AskResult) -> None:
-        """Display header with question info."""
+    def _render_header(self, result: AskResult) -> Panel:
+        """Render header with question info."""
         tickers_str = ", ".join(result.tickers) if result.tickers else "None detected"
 
         header_text = (
@@ -138,142 +165,125 @@ class AskFormatter:
         if result.include_market_data and result.tickers:
             header_text += " (with market data)"
 
-        self.console.print(Panel(
+        return Panel(
             header_text,
             title="Investor Q&A",
             border_style="blue",
-        ))
-
-    def _display_response_panel(self, result: AskResult, response: AskResponse) -> None:
-        """Display a response in a detailed panel."""
-        signal_color = self.SIGNAL_COLORS.get(response.signal, "white")
-        conf_color = self.CONFIDENCE_COLORS.get(response.confidence, "white")
-
-        # Build content
-        lines = []
-
-        # Question
-        lines.append(f"[bold]Question:[/bold] \"{result.question}\"")
+        )
 
-        # Tickers
+    def _render_response_panel(self, result: AskResult, response: AskResponse) -> Panel:
+        """Render a response in a detailed panel."""
+        # Question and tickers
+        header_block = f"[bold]Question:[/bold] \"{result.question}\"\n"
         if result.tickers:
-            lines.append(f"[bold]Tickers:[/bold] {', '.join(result.tickers)}")
-
-        lines.append("")
+            header_block += f"[bold]Tickers:[/bold] {', '.join(result.tickers)}\n"
 
-        # Signal info
-        signal_line = (
-            f"[bold]Signal:[/bold] [{signal_color}]{response.signal.value}[/{signal_color}]"
+        # Signal info, separator and reasoning
+        body_block = (
+            f"\n[bold]Signal:[/bold] {self.SIGNAL_MARKUP[response.signal]}"
             f"          "
-            f"[bold]Confidence:[/bold] [{conf_color}]{response.confidence.value}[/{conf_color}]"
+            f"[bold]Confidence:[/bold] {self.CONFIDENCE_MARKUP[response.confidence]}"
             f"          "
-            f"[bold]Score:[/bold] {response.weighted_score:.1f}"
+            f"[bold]Score:[/bold] {response.weighted_score:.1f}\n"
+            f"\n{_HR60_MARKUP}\n"
+            f"\n{response.reasoning}"
         )
-        lines.append(signal_line)
-
-        lines.append("")
-        lines.append("[dim]" + "─" * 60 + "[/dim]")
-        lines.append("")
-
-        # Reasoning
-        lines.append(response.reasoning)
 
         # Key factors
-        if response.key_factors:
-            lines.append("")
-            lines.append("[bold]Key Factors:[/bold]")
-            for factor in response.key_factors:
-                lines.append(f"  [green]•[/green] {factor}")
+        factors_block = (
+            "\n\n[bold]Key Factors:[/bold]\n"
+            + "\n".join(f"  [green]•[/green] {factor}" for factor in response.key_factors)
+            if response.key_factors
+            else ""
+        )
 
         # Risks
-        if response.risks:
-            lines.append("")
-            lines.append("[bold]Risks:[/bold]")
-            for risk in response.risks:
-                lines.append(f"  [red]•[/red] {risk}")
+        risks_block = (
+            "\n\n[bold]Risks:[/bold]\n"
+            + "\n".join(f"  [red]•[/red] {risk}" for risk in response.risks)
+            if response.risks
+            else ""
+        )
 
-        # Time horizon
+        # Time horizon and target price
+        footer_block = ""
         if response.time_horizon:
-            lines.append("")
-            lines.append(f"[bold]Time Horizon:[/bold] {response.time_horizon}")
-
-        # Target price
+            footer_block += f"\n\n[bold]Time Horizon:[/bold] {response.time_horizon}"
         if response.target_price:
-            lines.append(f"[bold]Target Price:[/bold] ${response.target_price:.2f}")
+            footer_block += f"\n[bold]Target Price:[/bold] ${response.target_price:.2f}"
 
-        content = "\n".join(lines)
+        content = header_block + body_block + factors_block + risks_block + footer_block
 
-        self.console.print(Panel(
+        return Panel(
             content,
             title=f"{response.agent_name}'s Response",
             border_style="cyan",
-        ))
+        )
 
-    def _display_summary_table(self, result: AskResult) -> None:
-        """Display summary table of all responses."""
+    def _render_summary_table(self, result: AskResult) -> Table:
+        """Render summary table of all responses."""
         table = Table(title="Response Summary")
         table.add_column("Investor", style="cyan", no_wrap=True)
         table.add_column("Signal", justify="center")
         table.add_column("Confidence", justify="center")
         table.add_column("Score", justify="right")
 
+        signal_colors = self.SIGNAL_COLORS
+        confidence_colors = self.CONFIDENCE_COLORS
+        styled = Text.styled
+        add_row = table.add_row
         for response in result.responses:
-            signal_color = self.SIGNAL_COLORS.get(response.signal, "white")
-            conf_color = self.CONFIDENCE_COLORS.get(response.confidence, "white")
-
-            table.add_row(
+            add_row(
                 response.agent_name,
-                f"[{signal_color}]{response.signal.value}[/{signal_color}]",
-                f"[{conf_color}]{response.confidence.value}[/{conf_color}]",
+                styled(response.signal.value, signal_colors[response.signal]),
+                styled(response.confidence.value, confidence_colors[response.confidence]),
                 f"{response.weighted_score:+.1f}",
             )
 
-        self.console.print(table)
+        return table
 
-    def _display_consensus(self, result: AskResult) -> None:
-        """Display consensus information."""
+    def _render_consensus(self, result: AskResult) -> str | None:
+        """Render consensus information."""
         consensus = result.consensus_signal
-        if consensus:
-            signal_color = self.SIGNAL_COLORS.get(consensus, "white")
-            self.console.print(
-                f"\n[bold]Consensus:[/bold] [{signal_color}]{consensus.value}[/{signal_color}] "
-                f"({result.bullish_count} bullish, {result.neutral_count} neutral, "
-                f"{result.bearish_count} bearish)"
-            )
+        if not consensus:
+            return None
+        bullish, neutral, bearish = result.signal_counts()
+        return (
+            f"\n[bold]Consensus:[/bold] {self.SIGNAL_MARKUP[consensus]} "
+            f"({bullish} bullish, {neutral} neutral, {bearish} bearish)"
+        )
 
-    def _display_response_section(self, response: AskResponse) -> None:
-        """Display a response as a section (for multi-response view)."""
+    def _render_response_section(self, response: AskResponse) -> list[RenderableType]:
+        """Render a response as a section (for multi-response view)."""
         signal_color = self.SIGNAL_COLORS.get(response.signal, "white")
 
         # Header line
         header = Text()
-        header.append("─" * 20 + " ", style="dim")
+        header.append(_HR20_DIM + " ", style="dim")
         header.append(response.agent_name, style="bold cyan")
         header.append(" ", style="dim")
         header.append(f"[{response.signal.value}]", style=signal_color)
-        header.append(" " + "─" * 20, style="dim")
-
-        self.console.print(header)
-        self.console.print()
+        header.append(" " + _HR20_DIM, style="dim")
 
         # Reasoning (wrapped)
-        self.console.print(response.reasoning)
+        renderables: list[RenderableType] = [header, "", response.reasoning]
 
         # Key factors (condensed)
         if response.key_factors:
             factors_str = " | ".join(response.key_factors[:3])
-            self.console.print(f"\n[bold]Key:[/bold] {factors_str}")
+            renderables.append(f"\n[bold]Key:[/bold] {factors_str}")
 
         # Risks (condensed)
         if response.risks:
             risks_str = " | ".join(response.risks[:2])
-            self.console.print(f"[bold]Risks:[/bold] {risks_str}")
+            renderables.append(f"[bold]Risks:[/bold] {risks_str}")
 
-        self.console.print()
+        renderables.append("")
+        return renderables
 
-    def _display_cost_footer(self, result: AskResult) -> None:
-        """Display cost information footer."""
-        self.console.print(
+    def _render_cost_footer(self, result: AskResult) -> str:
+        """Render cost information footer."""
+        return (
             f"\n[dim]Cost: ${result.total_cost_usd:.2f} | "
             f"Tokens: {result.total_input_tokens:,} in / {result.total_output_tokens:,} out | "
             f"Time: {result.execution_time_seconds:.1f}s[/dim]"
@@ -1,8 +1,12 @@
 """Rich formatters for backtest output."""
 
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
 from decimal import Decimal
+from itertools import chain, islice
+from typing import Final
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
@@ -13,13 +17,54 @@ from consilium.backtesting.models import (
     BacktestTrade,
     TradeAction,
 )
+from consilium.output.console import default_console, format_date
+
+_ZERO: Final[Decimal] = Decimal("0")
+
+# Pre-bound formatters for the per-trade columns
+_FMT_PRICE = "${:,.2f}".format
+_FMT_QTY = "{:,.4f}".format
+_FMT_PNL = "{:+,.2f}".format
+
+# Shared trade history cells; Rich copies Text when rendering, so reuse is safe
+_BUY_TEXT = Text.styled("BUY", "green")
+_SELL_TEXT = Text.styled("SELL", "red")
+_ELLIPSIS_TEXT = Text.styled("...", "dim")
+
+
+def _pct_markup(value: Decimal, digits: int = 2) -> str:
+    """Format a signed percentage as green/red markup."""
+    color = "green" if value >= 0 else "red"
+    return f"[{color}]{value:+.{digits}f}%[/{color}]"
+
+
+def _pct_text(value: Decimal) -> Text:
+    """Format a signed percentage as green/red text for table cells."""
+    return Text.styled(f"{value:+.2f}%", "green" if value >= 0 else "red")
+
+
+def _compact_line(result: BacktestResult, styled: bool) -> str:
+    """Format the one-line backtest summary, with Rich markup if styled."""
+    m = result.metrics
+    ticker = result.ticker
+    total_return = f"{m.total_return_pct:+.1f}%"
+    drawdown = f"-{m.max_drawdown:.1f}%"
+    if styled:
+        color = "green" if m.total_return_pct >= 0 else "red"
+        ticker = f"[bold]{ticker}[/bold]"
+        total_return = f"[{color}]{total_return}[/{color}]"
+        drawdown = f"[red]{drawdown}[/red]"
+    return (
+        f"{ticker} | {total_return} | Sharpe: {m.sharpe_ratio:.2f} | "
+        f"Max DD: {drawdown} | Trades: {m.total_trades} ({m.win_rate:.0f}% win)"
+    )
 
 
 class BacktestFormatter:
     """Formats backtest output for display."""
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or default_console()
 
     def display_result(
         self,
@@ -39,9 +84,11 @@ class BacktestFormatter:
         self._display_summary_panel(result)
 
         # Metrics sections
-        self._display_returns_section(result)
-        self._display_risk_section(result)
-        self._display_trade_stats_section(result)
+        self.console.print(Group(
+            self._render_returns_section(result),
+            self._render_risk_section(result),
+            self._render_trade_stats_section(result),
+        ))
 
         # Trade history table
         if show_trades and result.trades:
@@ -67,48 +114,37 @@ class BacktestFormatter:
         table.add_column("Sharpe", justify="right", width=8)
         table.add_column("Max DD", justify="right", width=8)
 
-        for bt in backtests:
-            # Format return with color
-            total_return = bt.get("total_return", Decimal("0"))
-            return_color = "green" if total_return >= 0 else "red"
-            return_str = f"[{return_color}]{total_return:+.1f}%[/{return_color}]"
-
-            # Format period
-            start = bt.get("start_date")
-            end = bt.get("end_date")
-            period_str = f"{start} - {end}" if start and end else "-"
-
-            # Format max drawdown
-            max_dd = bt.get("max_drawdown", Decimal("0"))
-            dd_str = f"[red]-{max_dd:.1f}%[/red]" if max_dd > 0 else "0%"
-
-            date_str = bt["created_at"].strftime("%Y-%m-%d") if bt.get("created_at") else "-"
-
-            table.add_row(
-                str(bt["id"]),
-                date_str,
-                bt.get("ticker", "-"),
-                period_str,
-                bt.get("strategy_type", "-"),
-                return_str,
-                f"{bt.get('sharpe_ratio', Decimal('0')):.2f}",
-                dd_str,
-            )
+        for row in [self._history_row(bt) for bt in backtests]:
+            table.add_row(*row)
 
         self.console.print(table)
 
+    @staticmethod
+    def _history_row(bt: dict) -> tuple[str, ...]:
+        """Format one backtest history entry as a table row."""
+        # Format period
+        start = bt.get("start_date")
+        end = bt.get("end_date")
+
+        # Format max drawdown
+        max_dd = bt.get("max_drawdown", _ZERO)
+
+        created_at = bt.get("created_at")
+        return (
+            str(bt["id"]),
+            format_date(created_at) if created_at else "-",
+            bt.get("ticker", "-"),
+            f"{start} - {end}" if start and end else "-",
+            bt.get("strategy_type", "-"),
+            _pct_markup(bt.get("total_return", _ZERO), 1),
+            f"{bt.get('sharpe_ratio', _ZERO):.2f}",
+            f"[red]-{max_dd:.1f}%[/red]" if max_dd > 0 else "0%",
+        )
+
     def _display_summary_panel(self, result: BacktestResult) -> None:
         """Display main summary panel."""
         m = result.metrics
 
-        # Format return with color
-        return_color = "green" if m.total_return_pct >= 0 else "red"
-        return_str = f"[{return_color}]{m.total_return_pct:+.2f}%[/{return_color}]"
-
-        # Format alpha with color
-        alpha_color = "green" if m.alpha >= 0 else "red"
-        alpha_str = f"[{alpha_color}]{m.alpha:+.2f}%[/{alpha_color}]"
-
         # Build summary content
         summary_lines = [
             f"[bold]Ticker:[/bold] {result.ticker}",
@@ -118,8 +154,8 @@ class BacktestFormatter:
             f"[bold]Initial Capital:[/bold] ${result.initial_capital:,.2f}",
             "",
             f"[bold]Final Value:[/bold] ${result.final_value:,.2f}",
-            f"[bold]Total Return:[/bold] {return_str} (${m.total_return:+,.2f})",
-            f"[bold]Alpha vs {result.benchmark}:[/bold] {alpha_str}",
+            f"[bold]Total Return:[/bold] {_pct_markup(m.total_return_pct)} (${m.total_return:+,.2f})",
+            f"[bold]Alpha vs {result.benchmark}:[/bold] {_pct_markup(m.alpha)}",
         ]
 
         if result.threshold_value:
@@ -137,8 +173,8 @@ class BacktestFormatter:
             box=box.ROUNDED,
         ))
 
-    def _display_returns_section(self, result: BacktestResult) -> None:
-        """Display returns metrics."""
+    def _render_returns_section(self, result: BacktestResult) -> Table:
+        """Render returns metrics."""
         m = result.metrics
 
         table = Table(
@@ -150,19 +186,14 @@ class BacktestFormatter:
         table.add_column("Metric", style="dim")
         table.add_column("Value", justify="right")
 
-        # Color formatting
-        cagr_color = "green" if m.cagr >= 0 else "red"
-        benchmark_color = "green" if m.benchmark_return >= 0 else "red"
-        excess_color = "green" if m.excess_return >= 0 else "red"
+        table.add_row("CAGR", _pct_text(m.cagr))
+        table.add_row("Benchmark Return", _pct_text(m.benchmark_return))
+        table.add_row("Excess Return", _pct_text(m.excess_return))
 
-        table.add_row("CAGR", f"[{cagr_color}]{m.cagr:+.2f}%[/{cagr_color}]")
-        table.add_row("Benchmark Return", f"[{benchmark_color}]{m.benchmark_return:+.2f}%[/{benchmark_color}]")
-        table.add_row("Excess Return", f"[{excess_color}]{m.excess_return:+.2f}%[/{excess_color}]")
+        return table
 
-        self.console.print(table)
-
-    def _display_risk_section(self, result: BacktestResult) -> None:
-        """Display risk metrics."""
+    def _render_risk_section(self, result: BacktestResult) -> Table:
+        """Render risk metrics."""
         m = result.metrics
 
         table = Table(
@@ -178,18 +209,18 @@ class BacktestFormatter:
         sharpe_color = "green" if m.sharpe_ratio > 1 else ("yellow" if m.sharpe_ratio > 0 else "red")
         sortino_color = "green" if m.sortino_ratio > 1 else ("yellow" if m.sortino_ratio > 0 else "red")
 
-        table.add_row("Sharpe Ratio", f"[{sharpe_color}]{m.sharpe_ratio:.2f}[/{sharpe_color}]")
-        table.add_row("Sortino Ratio", f"[{sortino_color}]{m.sortino_ratio:.2f}[/{sortino_color}]")
+        table.add_row("Sharpe Ratio", Text.styled(f"{m.sharpe_ratio:.2f}", sharpe_color))
+        table.add_row("Sortino Ratio", Text.styled(f"{m.sortino_ratio:.2f}", sortino_color))
         table.add_row("Calmar Ratio", f"{m.calmar_ratio:.2f}")
-        table.add_row("Max Drawdown", f"[red]-{m.max_drawdown:.2f}%[/red]")
+        table.add_row("Max Drawdown", Text.styled(f"-{m.max_drawdown:.2f}%", "red"))
         table.add_row("Max DD Duration", f"{m.max_drawdown_duration_days} days")
-        table.add_row("VaR (95%)", f"[red]-{m.var_95:.2f}%[/red]")
+        table.add_row("VaR (95%)", Text.styled(f"-{m.var_95:.2f}%", "red"))
         table.add_row("Beta", f"{m.beta:.2f}")
 
-        self.console.print(table)
+        return table
 
-    def _display_trade_stats_section(self, result: BacktestResult) -> None:
-        """Display trade statistics."""
+    def _render_trade_stats_section(self, result: BacktestResult) -> Table:
+        """Render trade statistics."""
         m = result.metrics
 
         table = Table(
@@ -205,18 +236,18 @@ class BacktestFormatter:
         win_color = "green" if m.win_rate >= 50 else "red"
 
         table.add_row("Total Trades", str(m.total_trades))
-        table.add_row("Winning Trades", f"[green]{m.winning_trades}[/green]")
-        table.add_row("Losing Trades", f"[red]{m.losing_trades}[/red]")
-        table.add_row("Win Rate", f"[{win_color}]{m.win_rate:.1f}%[/{win_color}]")
+        table.add_row("Winning Trades", Text.styled(str(m.winning_trades), "green"))
+        table.add_row("Losing Trades", Text.styled(str(m.losing_trades), "red"))
+        table.add_row("Win Rate", Text.styled(f"{m.win_rate:.1f}%", win_color))
         table.add_row("Profit Factor", f"{m.profit_factor:.2f}")
         table.add_row("Avg Holding Period", f"{m.avg_holding_days} days")
 
         if m.avg_win > 0:
-            table.add_row("Avg Win", f"[green]+${m.avg_win:,.2f}[/green]")
+            table.add_row("Avg Win", Text.styled(f"+${m.avg_win:,.2f}", "green"))
         if m.avg_loss > 0:
-            table.add_row("Avg Loss", f"[red]-${m.avg_loss:,.2f}[/red]")
+            table.add_row("Avg Loss", Text.styled(f"-${m.avg_loss:,.2f}", "red"))
 
-        self.console.print(table)
+        return table
 
     def _display_trade_history(
         self,
@@ -236,72 +267,72 @@ class BacktestFormatter:
         table.add_column("P&L", justify="right", width=14)
         table.add_column("Signal", width=12)
 
-        # Show first and last trades if too many
-        display_trades = trades
+        # Show first and last trades if too many (always at least one of each)
+        tail = max(max_trades // 2, 1)
+        head = max(max_trades - tail, 1)
+        shown = head + tail
+        display_trades: Iterable[BacktestTrade] = trades
         truncated = False
-        if len(trades) > max_trades:
-            half = max_trades // 2
-            display_trades = trades[:half] + trades[-half:]
+        if len(trades) > shown:
+            display_trades = chain(
+                islice(trades, head),
+                islice(trades, len(trades) - tail, None),
+            )
             truncated = True
 
+        add_row = table.add_row
         for i, trade in enumerate(display_trades):
             # Add separator if truncated
-            if truncated and i == max_trades // 2:
-                table.add_row(
-                    "[dim]...[/dim]",
-                    "[dim]...[/dim]",
-                    "[dim]...[/dim]",
-                    "[dim]...[/dim]",
-                    "[dim]...[/dim]",
-                    "[dim]...[/dim]",
-                    "[dim]...[/dim]",
-                )
+            if truncated and i == head:
+                add_row(*(_ELLIPSIS_TEXT,) * 7)
 
             # Format side with color
-            if trade.trade_type == TradeAction.BUY:
-                side_str = "[green]BUY[/green]"
-            else:
-                side_str = "[red]SELL[/red]"
+            side_str = _BUY_TEXT if trade.trade_type == TradeAction.BUY else _SELL_TEXT
 
             # Format P&L
-            pnl_str = "-"
+            pnl_str: Text | str = "-"
             if trade.realized_pnl is not None:
                 pnl_color = "green" if trade.realized_pnl >= 0 else "red"
-                pnl_str = f"[{pnl_color}]{trade.realized_pnl:+,.2f}[/{pnl_color}]"
+                pnl_str = Text.styled(_FMT_PNL(trade.realized_pnl), pnl_color)
 
             # Format signal
             signal_str = "-"
             if trade.signal:
                 signal_str = trade.signal.value
 
-            table.add_row(
+            add_row(
                 str(trade.trade_date),
                 side_str,
-                f"${trade.price:,.2f}",
-                f"{trade.quantity:,.4f}",
-                f"${trade.total_value:,.2f}",
+                _FMT_PRICE(trade.price),
+                _FMT_QTY(trade.quantity),
+                _FMT_PRICE(trade.total_value),
                 pnl_str,
                 signal_str,
             )
 
-        self.console.print()
-        self.console.print(table)
+        # Hand long histories to the system pager instead of flooding the terminal
+        pager: AbstractContextManager[object] = nullcontext()
+        if self.console.is_terminal and min(len(trades), shown) > self.console.size.height:
+            pager = self.console.pager(styles=True)
+
+        with pager:
+            self.console.print()
+            self.console.print(table)
 
         if truncated:
             self.console.print(
-                f"[dim]Showing {max_trades} of {len(trades)} trades. "
+                f"[dim]Showing {shown} of {len(trades)} trades. "
                 f"Use --all-trades to see all.[/dim]"
             )
 
     def display_compact(self, result: BacktestResult) -> None:
         """Display a compact one-line summary."""
-        m = result.metrics
-        return_color = "green" if m.total_return_pct >= 0 else "red"
-
-        self.console.print(
-            f"[bold]{result.ticker}[/bold] | "
-            f"[{return_color}]{m.total_return_pct:+.1f}%[/{return_color}] | "
-            f"Sharpe: {m.sharpe_ratio:.2f} | "
-            f"Max DD: [red]-{m.max_drawdown:.1f}%[/red] | "
-            f"Trades: {m.total_trades} ({m.win_rate:.0f}% win)"
-        )
+        # Plain output (pipes, CI logs) has no styles to render, so skip
+        # Rich's markup parsing and highlighting for the line.
+        if not self.console.is_terminal:
+            self.console.print(
+                Text(_compact_line(result, styled=False)), markup=False, highlight=False
+            )
+            return
+
+        self.console.print(_compact_line(result, styled=True))
@@ -1,13 +1,21 @@
 """Comparison formatter for side-by-side asset analysis."""
 
-from collections import defaultdict
-
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.table import Table
 from rich.panel import Panel
 
 from consilium.core.enums import SignalType, ConfidenceLevel
 from consilium.core.models import AnalysisResult, ConsensusResult
+from consilium.output.console import default_console
+
+# Short signal labels for the agent matrix
+_SIGNAL_ABBREVS = {
+    SignalType.STRONG_BUY: "S_BUY",
+    SignalType.BUY: "BUY",
+    SignalType.HOLD: "HOLD",
+    SignalType.SELL: "SELL",
+    SignalType.STRONG_SELL: "S_SELL",
+}
 
 
 class ComparisonFormatter:
@@ -29,8 +37,24 @@ class ComparisonFormatter:
         ConfidenceLevel.VERY_LOW: "bold red",
     }
 
+    # Pre-rendered "[color]VALUE[/color]" markup, built once at import time
+    SIGNAL_MARKUP: dict[SignalType, str] = {
+        signal: f"[{color}]{signal.value}[/{color}]"
+        for signal, color in SIGNAL_COLORS.items()
+    }
+
+    CONFIDENCE_MARKUP: dict[ConfidenceLevel, str] = {
+        level: f"[{color}]{level.value}[/{color}]"
+        for level, color in CONFIDENCE_COLORS.items()
+    }
+
+    SIGNAL_ABBREV_MARKUP: dict[SignalType, str] = {
+        signal: f"[{color}]{_SIGNAL_ABBREVS[signal]}[/{color}]"
+        for signal, color in SIGNAL_COLORS.items()
+    }
+
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or default_console()
 
     def display_comparison(
         self,
@@ -41,39 +65,67 @@ class ComparisonFormatter:
         verbose: bool = False,
     ) -> None:
         """Display full comparison output."""
-        self.console.print()
-
         # Header
-        self._display_header(result)
+        renderables: list[RenderableType] = ["", self._render_header(result)]
+
+        # Sort once per ordering and share it with every section; the
+        # by-score column order is only built when a section needs it
+        sorted_results = self._sort_results(result.results, sort_by)
+        by_score = sorted_results if sort_by == "score" else None
 
         # Ranking table (always shown)
-        self.display_ranking_table(result.results, sort_by)
+        renderables.append(
+            self._render_ranking_table(result.results, sort_by, sorted_results)
+        )
 
         # Winner announcement
         if result.results:
-            self._display_winner(result.results, sort_by)
+            renderables.append(self._render_winner(sorted_results))
 
         # Optional: Agent matrix
         if show_matrix or verbose:
-            self.display_agent_matrix(result.results)
+            if by_score is None:
+                by_score = self._sort_results(result.results, "score")
+            renderables.extend(self._render_agent_matrix(result.results, by_score))
 
         # Optional: Themes comparison
         if show_themes or verbose:
-            self.display_themes_comparison(result.results)
-            self.display_risks_comparison(result.results)
+            all_themes, theme_map, all_risks, risk_map = (
+                self._collect_themes_and_risks(result.results)
+            )
+            if by_score is None and (all_themes or all_risks):
+                by_score = self._sort_results(result.results, "score")
+            renderables.extend(
+                self._render_themes_table(result.results, by_score, all_themes, theme_map)
+            )
+            renderables.extend(
+                self._render_risks_table(result.results, by_score, all_risks, risk_map)
+            )
+
+        self.console.print(Group(*renderables))
 
     def display_ranking_table(
         self,
         results: list[ConsensusResult],
         sort_by: str = "score",
+        sorted_results: list[ConsensusResult] | None = None,
     ) -> None:
         """Display ranking table sorted by metric."""
+        self.console.print(self._render_ranking_table(results, sort_by, sorted_results))
+
+    def _render_ranking_table(
+        self,
+        results: list[ConsensusResult],
+        sort_by: str,
+        sorted_results: list[ConsensusResult] | None,
+    ) -> RenderableType:
+        """Render ranking table sorted by metric."""
         if not results:
-            self.console.print("[yellow]No results to compare.[/yellow]")
-            return
+            return "[yellow]No results to compare.[/yellow]"
 
-        # Sort results
-        sorted_results = self._sort_results(results, sort_by)
+        # Sort results unless the caller already did
+        if sorted_results is None:
+            sorted_results = self._sort_results(results, sort_by)
 
         table = Table(title=f"Asset Comparison (sorted by {sort_by})")
         table.add_column("Rank", style="dim", width=4)
@@ -85,25 +137,34 @@ class ComparisonFormatter:
         table.add_column("Votes", width=14)
 
         for idx, r in enumerate(sorted_results, 1):
-            signal_color = self.SIGNAL_COLORS.get(r.final_signal, "white")
-            conf_color = self.CONFIDENCE_COLORS.get(r.confidence, "white")
-
             table.add_row(
                 str(idx),
                 r.ticker,
-                f"[{signal_color}]{r.final_signal.value}[/{signal_color}]",
+                self.SIGNAL_MARKUP[r.final_signal],
                 f"{r.weighted_score:.1f}",
-                f"[{conf_color}]{r.confidence.value}[/{conf_color}]",
+                self.CONFIDENCE_MARKUP[r.confidence],
                 f"{r.agreement_ratio:.0%}",
                 f"{r.buy_votes}B {r.hold_votes}H {r.sell_votes}S",
             )
 
-        self.console.print(table)
+        return table
 
-    def display_agent_matrix(self, results: list[ConsensusResult]) -> None:
+    def display_agent_matrix(
+        self,
+        results: list[ConsensusResult],
+        sorted_results: list[ConsensusResult] | None = None,
+    ) -> None:
         """Display agent consensus matrix across assets."""
+        self._print_all(self._render_agent_matrix(results, sorted_results))
+
+    def _render_agent_matrix(
+        self,
+        results: list[ConsensusResult],
+        sorted_results: list[ConsensusResult] | None,
+    ) -> list[RenderableType]:
+        """Render agent consensus matrix, preceded by a blank line."""
         if not results:
-            return
+            return []
 
         # Collect all agents
         all_agents: set[str] = set()
@@ -112,107 +173,144 @@ class ComparisonFormatter:
                 all_agents.add(resp.agent_name)
 
         if not all_agents:
-            return
+            return []
 
         sorted_agents = sorted(list(all_agents))
 
-        self.console.print()
         table = Table(title="Agent Consensus Matrix")
         table.add_column("Agent", style="cyan", no_wrap=True, width=20)
 
         # Sort results by score for column order
-        sorted_results = self._sort_results(results, "score")
+        if sorted_results is None:
+            sorted_results = self._sort_results(results, "score")
 
         for r in sorted_results:
             table.add_column(r.ticker, justify="center", width=8)
 
-        # Build signal map
-        signal_map: dict[str, dict[str, SignalType]] = defaultdict(dict)
-        for r in results:
+        # Build a dense agent x column signal matrix in one pass. Columns are
+        # filled by position, so repeated tickers keep separate columns.
+        agent_idx = {name: i for i, name in enumerate(sorted_agents)}
+        matrix: list[list[SignalType | None]] = [
+            [None] * len(sorted_results) for _ in sorted_agents
+        ]
+        for j, r in enumerate(sorted_results):
             for resp in r.agent_responses:
-                signal_map[resp.agent_name][r.ticker] = resp.signal
+                matrix[agent_idx[resp.agent_name]][j] = resp.signal
 
-        for agent in sorted_agents:
+        for agent, signals in zip(sorted_agents, matrix, strict=True):
             row = [agent]
-            for r in sorted_results:
-                signal = signal_map.get(agent, {}).get(r.ticker)
+            for signal in signals:
                 if signal:
-                    color = self.SIGNAL_COLORS.get(signal, "white")
-                    abbrev = self._abbreviate_signal(signal)
-                    row.append(f"[{color}]{abbrev}[/{color}]")
+                    row.append(self.SIGNAL_ABBREV_MARKUP[signal])
                 else:
                     row.append("[dim]-[/dim]")
             table.add_row(*row)
 
-        self.console.print(table)
+        return ["", table]
 
-    def display_themes_comparison(self, results: list[ConsensusResult]) -> None:
+    def display_themes_comparison(
+        self,
+        results: list[ConsensusResult],
+        sorted_results: list[ConsensusResult] | None = None,
+    ) -> None:
         """Display common themes across assets."""
         if not results:
             return
 
-        # Collect all themes
+        all_themes, theme_map, _, _ = self._collect_themes_and_risks(results)
+        self._print_all(
+            self._render_themes_table(results, sorted_results, all_themes, theme_map)
+        )
+
+    def display_risks_comparison(
+        self,
+        results: list[ConsensusResult],
+        sorted_results: list[ConsensusResult] | None = None,
+    ) -> None:
+        """Display common risks across assets."""
+        if not results:
+            return
+
+        _, _, all_risks, risk_map = self._collect_themes_and_risks(results)
+        self._print_all(
+            self._render_risks_table(results, sorted_results, all_risks, risk_map)
+        )
+
+    def _collect_themes_and_risks(
+        self,
+        results: list[ConsensusResult],
+    ) -> tuple[set[str], dict[str, frozenset[str]], set[str], dict[str, frozenset[str]]]:
+        """Collect themes and risks per ticker in a single pass."""
         all_themes: set[str] = set()
-        theme_map: dict[str, set[str]] = {}
+        theme_map: dict[str, frozenset[str]] = {}
+        all_risks: set[str] = set()
+        risk_map: dict[str, frozenset[str]] = {}
         for r in results:
-            theme_map[r.ticker] = set(r.key_themes)
+            theme_map[r.ticker] = frozenset(r.key_themes)
             all_themes.update(r.key_themes)
+            risk_map[r.ticker] = frozenset(r.primary_risks)
+            all_risks.update(r.primary_risks)
+        return all_themes, theme_map, all_risks, risk_map
 
+    def _render_themes_table(
+        self,
+        results: list[ConsensusResult],
+        sorted_results: list[ConsensusResult] | None,
+        all_themes: set[str],
+        theme_map: dict[str, frozenset[str]],
+    ) -> list[RenderableType]:
+        """Render the themes table from collected themes, preceded by a blank line."""
         if not all_themes:
-            return
+            return []
 
-        self.console.print()
         table = Table(title="Key Themes Comparison")
         table.add_column("Theme", style="white", width=30)
 
-        sorted_results = self._sort_results(results, "score")
+        if sorted_results is None:
+            sorted_results = self._sort_results(results, "score")
         for r in sorted_results:
             table.add_column(r.ticker, justify="center", width=8)
 
         for theme in sorted(all_themes):
             row = [theme]
             for r in sorted_results:
-                if theme in theme_map.get(r.ticker, set()):
+                if theme in theme_map[r.ticker]:
                     row.append("[green]✓[/green]")
                 else:
                     row.append("[dim]-[/dim]")
             table.add_row(*row)
 
-        self.console.print(table)
-
-    def display_risks_comparison(self, results: list[ConsensusResult]) -> None:
-        """Display common risks across assets."""
-        if not results:
-            return
-
-        # Collect all risks
-        all_risks: set[str] = set()
-        risk_map: dict[str, set[str]] = {}
-        for r in results:
-            risk_map[r.ticker] = set(r.primary_risks)
-            all_risks.update(r.primary_risks)
+        return ["", table]
 
+    def _render_risks_table(
+        self,
+        results: list[ConsensusResult],
+        sorted_results: list[ConsensusResult] | None,
+        all_risks: set[str],
+        risk_map: dict[str, frozenset[str]],
+    ) -> list[RenderableType]:
+        """Render the risks table from collected risks, preceded by a blank line."""
         if not all_risks:
-            return
+            return []
 
-        self.console.print()
         table = Table(title="Risk Factors Comparison")
         table.add_column("Risk", style="white", width=30)
 
-        sorted_results = self._sort_results(results, "score")
+        if sorted_results is None:
+            sorted_results = self._sort_results(results, "score")
         for r in sorted_results:
             table.add_column(r.ticker, justify="center", width=8)
 
         for risk in sorted(all_risks):
             row = [risk]
             for r in sorted_results:
-                if risk in risk_map.get(r.ticker, set()):
+                if risk in risk_map[r.ticker]:
                     row.append("[red]✓[/red]")
                 else:
                     row.append("[dim]-[/dim]")
             table.add_row(*row)
 
-        self.console.print(table)
+        return ["", table]
 
     def _sort_results(
         self,
@@ -232,40 +330,27 @@ class ComparisonFormatter:
             )
         return results
 
-    def _display_winner(
-        self,
-        results: list[ConsensusResult],
-        sort_by: str,
-    ) -> None:
-        """Display the winning asset."""
-        sorted_results = self._sort_results(results, sort_by)
+    def _render_winner(self, sorted_results: list[ConsensusResult]) -> str:
+        """Render the winning asset."""
         winner = sorted_results[0]
         signal_color = self.SIGNAL_COLORS.get(winner.final_signal, "white")
 
-        self.console.print(
+        return (
             f"\n[bold]Winner:[/bold] [{signal_color}]{winner.ticker}[/{signal_color}] "
             f"with {winner.final_signal.value} signal and {winner.agreement_ratio:.0%} agreement\n"
         )
 
-    def _display_header(self, result: AnalysisResult) -> None:
-        """Display comparison header."""
-        self.console.print(
-            Panel(
-                f"[bold]Comparison Analysis[/bold]\n"
-                f"Tickers: {', '.join(result.tickers)}\n"
-                f"Agents: {result.agents_used} | Time: {result.execution_time_seconds:.1f}s",
-                title="Consilium Compare",
-                border_style="blue",
-            )
+    def _render_header(self, result: AnalysisResult) -> Panel:
+        """Render comparison header."""
+        return Panel(
+            f"[bold]Comparison Analysis[/bold]\n"
+            f"Tickers: {', '.join(result.tickers)}\n"
+            f"Agents: {result.agents_used} | Time: {result.execution_time_seconds:.1f}s",
+            title="Consilium Compare",
+            border_style="blue",
         )
 
-    def _abbreviate_signal(self, signal: SignalType) -> str:
-        """Abbreviate signal for matrix display."""
-        abbrevs = {
-            SignalType.STRONG_BUY: "S_BUY",
-            SignalType.BUY: "BUY",
-            SignalType.HOLD: "HOLD",
-            SignalType.SELL: "SELL",
-            SignalType.STRONG_SELL: "S_SELL",
-        }
-        return abbrevs.get(signal, signal.value)
+    def _print_all(self, renderables: list[RenderableType]) -> None:
+        """Print renderables as one group, if there are any."""
+        if renderables:
+            self.console.print(Group(*renderables))
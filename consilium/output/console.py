@@ -0,0 +1,24 @@
+"""Shared Rich console and formatting helpers for formatters."""
+
+from datetime import date, datetime
+from functools import lru_cache
+
+from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def default_console() -> Console:
+    """Get the console used by formatters when none is passed in."""
+    return Console()
+
+
+@lru_cache(maxsize=512)
+def _format_day(day: date) -> str:
+    return day.strftime("%Y-%m-%d")
+
+
+def format_date(value: date) -> str:
+    """Format a date or datetime as YYYY-MM-DD, cached per calendar day."""
+    if isinstance(value, datetime):
+        value = value.date()
+    return _format_day(value)
@@ -6,13 +6,14 @@ from rich.panel import Panel
 from rich.text import Text
 
 from consilium.llm.cost_estimator import CostEstimate, CostEstimator
+from consilium.output.console import default_console
 
 
 class CostDisplay:
     """Displays cost estimates to user."""
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or default_console()
 
     def display(self, estimate: CostEstimate) -> None:
         """Display cost estimate with breakdown table."""
@@ -1,25 +1,43 @@
 """Export utilities for analysis results."""
 
 import csv
-import json
-from datetime import datetime
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
 
 from consilium.core.models import AnalysisResult, ConsensusResult
+from consilium.core.serialization import dumps_indented
 from consilium.analysis.reporter import AnalysisReporter
 
-
-class DecimalEncoder(json.JSONEncoder):
-    """JSON encoder that handles Decimal types."""
-
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, Decimal):
-            return float(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# CSV column order; rows are written positionally to match
+_DETAIL_FIELDNAMES = (
+    "ticker",
+    "consensus_signal",
+    "consensus_score",
+    "consensus_confidence",
+    "agent_id",
+    "agent_name",
+    "agent_signal",
+    "agent_confidence",
+    "target_price",
+    "time_horizon",
+    "reasoning",
+    "analyzed_at",
+)
+
+_SUMMARY_FIELDNAMES = (
+    "ticker",
+    "signal",
+    "confidence",
+    "score",
+    "buy_votes",
+    "hold_votes",
+    "sell_votes",
+    "agreement",
+    "dissenters",
+    "key_themes",
+    "primary_risks",
+    "generated_at",
+)
 
 
 class JSONExporter:
@@ -29,85 +47,80 @@ class JSONExporter:
         """Export analysis result to JSON file."""
         data = result.model_dump()
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, cls=DecimalEncoder, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(dumps_indented(data))
 
     def export_consensus(self, result: ConsensusResult, file_path: str | Path) -> None:
         """Export single consensus result to JSON file."""
         data = result.model_dump()
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, cls=DecimalEncoder, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(dumps_indented(data))
 
     def to_string(self, result: AnalysisResult) -> str:
         """Convert analysis result to JSON string."""
         data = result.model_dump()
-        return json.dumps(data, cls=DecimalEncoder, indent=2)
+        return dumps_indented(data).decode()
 
 
 class CSVExporter:
     """Export results to CSV format."""
 
+    @staticmethod
+    def has_rows(result: AnalysisResult) -> bool:
+        """Check whether the result has agent responses to write."""
+        return any(consensus.agent_responses for consensus in result.results)
+
     def export(self, result: AnalysisResult, file_path: str | Path) -> None:
         """Export analysis result to CSV file."""
-        rows = []
-
-        for consensus in result.results:
-            for response in consensus.agent_responses:
-                rows.append({
-                    "ticker": consensus.ticker,
-                    "consensus_signal": consensus.final_signal.value,
-                    "consensus_score": float(consensus.weighted_score),
-                    "consensus_confidence": consensus.confidence.value,
-                    "agent_id": response.agent_id,
-                    "agent_name": response.agent_name,
-                    "agent_signal": response.signal.value,
-                    "agent_confidence": response.confidence.value,
-                    "target_price": float(response.target_price) if response.target_price else "",
-                    "time_horizon": response.time_horizon or "",
-                    "reasoning": response.reasoning[:200],  # Truncate for CSV
-                    "analyzed_at": response.analyzed_at.isoformat(),
-                })
-
-        if not rows:
+        if not self.has_rows(result):
             return
 
-        fieldnames = list(rows[0].keys())
-
         with open(file_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(_DETAIL_FIELDNAMES)
+
+            for consensus in result.results:
+                for response in consensus.agent_responses:
+                    writer.writerow((
+                        consensus.ticker,
+                        consensus.final_signal.value,
+                        float(consensus.weighted_score),
+                        consensus.confidence.value,
+                        response.agent_id,
+                        response.agent_name,
+                        response.signal.value,
+                        response.confidence.value,
+                        float(response.target_price) if response.target_price else "",
+                        response.time_horizon or "",
+                        response.reasoning[:200],  # Truncate for CSV
+                        response.analyzed_at.isoformat(),
+                    ))
 
     def export_summary(self, result: AnalysisResult, file_path: str | Path) -> None:
         """Export summary-only CSV (one row per ticker)."""
-        rows = []
-
-        for consensus in result.results:
-            rows.append({
-                "ticker": consensus.ticker,
-                "signal": consensus.final_signal.value,
-                "confidence": consensus.confidence.value,
-                "score": float(consensus.weighted_score),
-                "buy_votes": consensus.buy_votes,
-                "hold_votes": consensus.hold_votes,
-                "sell_votes": consensus.sell_votes,
-                "agreement": float(consensus.agreement_ratio),
-                "dissenters": ", ".join(consensus.dissenters),
-                "key_themes": "; ".join(consensus.key_themes[:3]),
-                "primary_risks": "; ".join(consensus.primary_risks[:3]),
-                "generated_at": consensus.generated_at.isoformat(),
-            })
-
-        if not rows:
+        if not result.results:
             return
 
-        fieldnames = list(rows[0].keys())
-
         with open(file_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(f)
+            writer.writerow(_SUMMARY_FIELDNAMES)
+
+            for consensus in result.results:
+                writer.writerow((
+                    consensus.ticker,
+                    consensus.final_signal.value,
+                    consensus.confidence.value,
+                    float(consensus.weighted_score),
+                    consensus.buy_votes,
+                    consensus.hold_votes,
+                    consensus.sell_votes,
+                    float(consensus.agreement_ratio),
+                    ", ".join(consensus.dissenters),
+                    "; ".join(consensus.key_themes[:3]),
+                    "; ".join(consensus.primary_risks[:3]),
+                    consensus.generated_at.isoformat(),
+                ))
 
 
 class MarkdownExporter:
@@ -158,3 +171,38 @@ def export_result(
         MarkdownExporter().export(result, file_path)
     else:
         raise ValueError(f"Unknown export format: {format}")
+
+
+def export_all(
+    result: AnalysisResult,
+    base_path: str | Path,
+    formats: tuple[str, ...] = ("json", "csv", "md"),
+) -> list[Path]:
+    """
+    Export analysis result to several formats concurrently.
+
+    Args:
+        result: Analysis result to export
+        base_path: Output path without extension; each format appends its own
+        formats: Export formats ('json', 'csv', 'md')
+
+    Returns:
+        Paths of the files written, in the order of formats. CSV is skipped
+        when there are no agent responses.
+    """
+    paths = [Path(f"{base_path}.{fmt.lower()}") for fmt in formats]
+    jobs = [
+        (path, fmt)
+        for path, fmt in zip(paths, formats, strict=True)
+        if fmt.lower() != "csv" or CSVExporter.has_rows(result)
+    ]
+    if not jobs:
+        return []
+
+    # Exporters are I/O bound, so threads overlap the file writes
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(export_result, result, path, fmt) for path, fmt in jobs]
+        for future in futures:
+            future.result()
+
+    return [path for path, _ in jobs]
@@ -8,6 +8,7 @@ from rich.columns import Columns
 
 from consilium.core.enums import SignalType, ConfidenceLevel
 from consilium.core.models import ConsensusResult, AnalysisResult, AgentResponse
+from consilium.output.console import default_console
 
 
 class ResultFormatter:
@@ -29,8 +30,19 @@ class ResultFormatter:
         ConfidenceLevel.VERY_LOW: "bold red",
     }
 
+    # Pre-rendered "[color]VALUE[/color]" markup, built once at import time
+    SIGNAL_MARKUP: dict[SignalType, str] = {
+        signal: f"[{color}]{signal.value}[/{color}]"
+        for signal, color in SIGNAL_COLORS.items()
+    }
+
+    CONFIDENCE_MARKUP: dict[ConfidenceLevel, str] = {
+        level: f"[{color}]{level.value}[/{color}]"
+        for level, color in CONFIDENCE_COLORS.items()
+    }
+
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or default_console()
 
     def display_results(
         self,
@@ -64,7 +76,6 @@ class ResultFormatter:
 
         # Signal panel
         signal_color = self.SIGNAL_COLORS.get(result.final_signal, "white")
-        confidence_color = self.CONFIDENCE_COLORS.get(result.confidence, "white")
 
         signal_text = Text()
         signal_text.append(f"{result.final_signal.value}", style=signal_color)
@@ -72,8 +83,8 @@ class ResultFormatter:
         self.console.print(
             Panel(
                 f"[bold]{result.ticker}[/bold]\n\n"
-                f"Signal: [{signal_color}]{result.final_signal.value}[/{signal_color}]\n"
-                f"Confidence: [{confidence_color}]{result.confidence.value}[/{confidence_color}]\n"
+                f"Signal: {self.SIGNAL_MARKUP[result.final_signal]}\n"
+                f"Confidence: {self.CONFIDENCE_MARKUP[result.confidence]}\n"
                 f"Score: {result.weighted_score:.1f}\n\n"
                 f"Votes: {result.buy_votes} Buy | {result.hold_votes} Hold | {result.sell_votes} Sell\n"
                 f"Agreement: {result.agreement_ratio:.0%}",
@@ -116,16 +127,13 @@ class ResultFormatter:
         table.add_column("Reasoning", max_width=50)
 
         for response in result.agent_responses:
-            signal_color = self.SIGNAL_COLORS.get(response.signal, "white")
-            conf_color = self.CONFIDENCE_COLORS.get(response.confidence, "white")
-
             target = f"${response.target_price:.2f}" if response.target_price else "-"
             reasoning = response.reasoning[:100] + "..." if len(response.reasoning) > 100 else response.reasoning
 
             table.add_row(
                 response.agent_name,
-                f"[{signal_color}]{response.signal.value}[/{signal_color}]",
-                f"[{conf_color}]{response.confidence.value}[/{conf_color}]",
+                self.SIGNAL_MARKUP[response.signal],
+                self.CONFIDENCE_MARKUP[response.confidence],
                 target,
                 reasoning,
             )
@@ -139,7 +147,7 @@ class ResultFormatter:
         self.console.print(
             Panel(
                 f"[bold]{response.agent_name}[/bold] on {response.ticker}\n\n"
-                f"Signal: [{signal_color}]{response.signal.value}[/{signal_color}]\n"
+                f"Signal: {self.SIGNAL_MARKUP[response.signal]}\n"
                 f"Confidence: {response.confidence.value}\n"
                 f"Target: ${response.target_price:.2f}" if response.target_price else "Target: N/A\n"
                 f"Horizon: {response.time_horizon or 'N/A'}\n\n"
@@ -1,6 +1,7 @@
 """Rich console formatters for portfolio display."""
 
 from decimal import Decimal
+from typing import Final
 
 from rich.console import Console, Group
 from rich.table import Table
@@ -24,6 +25,9 @@ from consilium.core.portfolio_models import (
     ConcentrationRisk,
     CSVImportResult,
 )
+from consilium.output.console import default_console
+
+_ZERO: Final[Decimal] = Decimal("0")
 
 
 class PortfolioFormatter:
@@ -61,7 +65,7 @@ class PortfolioFormatter:
     }
 
     def __init__(self, console: Console | None = None) -> None:
-        self.console = console or Console()
+        self.console = console or default_console()
 
     # ========== Portfolio List ==========
 
@@ -521,7 +525,7 @@ class PortfolioFormatter:
         buy_count = sum(1 for t in filtered if t.transaction_type == TransactionType.BUY)
         sell_count = sum(1 for t in filtered if t.transaction_type == TransactionType.SELL)
         total_realized = sum(
-            t.realized_pnl or Decimal("0")
+            t.realized_pnl or _ZERO
             for t in filtered
             if t.transaction_type == TransactionType.SELL
         )
@@ -549,7 +553,7 @@ class PortfolioFormatter:
         if performance.total_cost_basis > 0:
             total_return_pct = (performance.total_pnl / performance.total_cost_basis) * 100
         else:
-            total_return_pct = Decimal("0")
+            total_return_pct = _ZERO
 
         # Build content
         content_lines = [
@@ -625,7 +629,7 @@ class PortfolioFormatter:
         table.add_column("Holding Days", justify="right")
 
         for ticker, data in sorted(pnl_by_ticker.items()):
-            pnl = data.get("realized_pnl", Decimal("0"))
+            pnl = data.get("realized_pnl", _ZERO)
             pnl_color = "green" if pnl >= 0 else "red"
             pnl_sign = "+" if pnl >= 0 else ""
 
@@ -687,7 +691,7 @@ class PortfolioFormatter:
             ]
 
             if any(r.get("fees") for r in rows):
-                fees = row.get("fees", Decimal("0"))
+                fees = row.get("fees", _ZERO)
                 row_data.append(f"${fees:.2f}" if fees > 0 else "-")
 
             table.add_row(*row_data)
@@ -0,0 +1,61 @@
+"""Tests for backtest output formatting."""
+
+import io
+import re
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from rich.console import Console
+
+from consilium.backtesting.models import BacktestTrade, TradeAction
+from consilium.output.backtest_formatter import BacktestFormatter
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _trades(count: int) -> list[BacktestTrade]:
+    start = date(2024, 1, 1)
+    return [
+        BacktestTrade(
+            trade_date=start + timedelta(days=i),
+            trade_type=TradeAction.BUY if i % 2 == 0 else TradeAction.SELL,
+            price=Decimal("100"),
+            quantity=Decimal("1"),
+        )
+        for i in range(count)
+    ]
+
+
+def _render_history(trades: list[BacktestTrade], max_trades: int) -> str:
+    buffer = io.StringIO()
+    formatter = BacktestFormatter(Console(file=buffer, width=120, force_terminal=False))
+    formatter._display_trade_history(trades, max_trades)
+    return buffer.getvalue()
+
+
+class TestTradeHistory:
+    """Test suite for trade history truncation."""
+
+    @pytest.mark.parametrize("count,max_trades", [(5, 20), (20, 20), (2, 1)])
+    def test_short_history_is_not_truncated(self, count, max_trades):
+        """Test that every trade is listed when they fit."""
+        trades = _trades(count)
+        output = _render_history(trades, max_trades)
+
+        assert _DATE_RE.findall(output) == [str(t.trade_date) for t in trades]
+        assert "Showing" not in output
+
+    @pytest.mark.parametrize(
+        "count,max_trades,head,tail",
+        [(21, 20, 10, 10), (30, 21, 11, 10), (5, 1, 1, 1), (5, 0, 1, 1)],
+    )
+    def test_long_history_keeps_first_and_last(self, count, max_trades, head, tail):
+        """Test that truncation keeps the first and last trades around a separator."""
+        trades = _trades(count)
+        output = _render_history(trades, max_trades)
+
+        expected = trades[:head] + trades[-tail:]
+        assert _DATE_RE.findall(output) == [str(t.trade_date) for t in expected]
+        assert "..." in output
+        assert f"Showing {head + tail} of {count} trades" in output
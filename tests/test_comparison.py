@@ -0,0 +1,49 @@
+"""Tests for the comparison formatter."""
+
+import io
+from decimal import Decimal
+
+from rich.console import Console
+
+from consilium.core.enums import ConfidenceLevel, SignalType
+from consilium.core.models import ConsensusResult
+from consilium.output.comparison import ComparisonFormatter
+
+
+def _consensus(responses, score: str) -> ConsensusResult:
+    return ConsensusResult(
+        ticker="AAPL",
+        final_signal=SignalType.HOLD,
+        signal_score=Decimal(score),
+        confidence=ConfidenceLevel.MEDIUM,
+        buy_votes=0,
+        sell_votes=0,
+        hold_votes=len(responses),
+        weighted_score=Decimal(score),
+        agent_responses=responses,
+        consensus_reasoning="",
+    )
+
+
+class TestAgentMatrix:
+    """Test suite for the agent consensus matrix."""
+
+    def test_repeated_ticker_keeps_separate_columns(self, sample_agent_responses):
+        """Test that two results for the same ticker each fill their own column."""
+        buffett, munger = sample_agent_responses[:2]
+        bullish = _consensus([buffett.model_copy(update={"signal": SignalType.BUY})], "50")
+        bearish = _consensus([munger.model_copy(update={"signal": SignalType.SELL})], "-50")
+
+        buffer = io.StringIO()
+        formatter = ComparisonFormatter(Console(file=buffer, width=120, force_terminal=False))
+        formatter.display_agent_matrix([bearish, bullish])
+
+        rows = {
+            line.split("│")[1].strip(): [cell.strip() for cell in line.split("│")[2:4]]
+            for line in buffer.getvalue().splitlines()
+            if "│" in line and ("Buffett" in line or "Munger" in line)
+        }
+        assert rows == {
+            "Warren Buffett": ["BUY", "-"],
+            "Charlie Munger": ["-", "SELL"],
+        }
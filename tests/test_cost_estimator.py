@@ -0,0 +1,75 @@
+"""Tests for the cost estimator."""
+
+from decimal import Decimal
+
+import pytest
+
+from consilium.llm.cost_estimator import CostEstimator, ModelPricing
+
+MODELS = list(CostEstimator.PRICING)
+
+
+def _decimal_cost(pricing: ModelPricing, input_tokens: int, output_tokens: int) -> Decimal:
+    """Reference cost computed directly in Decimal, per million tokens."""
+    million = Decimal("1000000")
+    return (
+        Decimal(input_tokens) / million * pricing.input_per_mtok
+        + Decimal(output_tokens) / million * pricing.output_per_mtok
+    )
+
+
+class TestCostEstimator:
+    """Test suite for CostEstimator."""
+
+    @pytest.mark.parametrize("model", MODELS)
+    @pytest.mark.parametrize(
+        "input_tokens,output_tokens",
+        [(0, 0), (1, 1), (600, 500), (123_457, 9_876), (10_000_000, 3_000_001)],
+    )
+    def test_calculate_cost_matches_decimal(self, model, input_tokens, output_tokens):
+        """Test that the integer pico-USD math equals plain Decimal math."""
+        estimator = CostEstimator(model)
+        assert estimator._calculate_cost(input_tokens, output_tokens) == _decimal_cost(
+            estimator.pricing, input_tokens, output_tokens
+        )
+
+    @pytest.mark.parametrize("model", MODELS)
+    @pytest.mark.parametrize("num_tickers", [1, 3, 17])
+    @pytest.mark.parametrize("include_specialists", [True, False])
+    def test_estimate_matches_decimal(self, model, num_tickers, include_specialists):
+        """Test per-component and total costs against Decimal math on the token counts."""
+        estimator = CostEstimator(model)
+        estimate = estimator.estimate(
+            num_tickers, num_investors=5, include_specialists=include_specialists
+        )
+
+        expected_components = ["Specialists", "Investors"] if include_specialists else ["Investors"]
+        assert [b.component for b in estimate.breakdowns] == expected_components
+        for breakdown in estimate.breakdowns:
+            assert breakdown.cost_usd == _decimal_cost(
+                estimator.pricing, breakdown.input_tokens, breakdown.output_tokens
+            )
+        assert estimate.total_cost_usd == _decimal_cost(
+            estimator.pricing, estimate.total_input_tokens, estimate.total_output_tokens
+        )
+
+    def test_estimate_known_total(self):
+        """Test one estimate against a hand-computed total."""
+        estimate = CostEstimator("claude-sonnet-4-20250514").estimate(2)
+
+        # 14 specialist calls (600 in / 500 out) + 26 investor calls (2500 in / 700 out)
+        assert estimate.total_api_calls == 40
+        assert estimate.total_input_tokens == 73_400
+        assert estimate.total_output_tokens == 25_200
+        assert estimate.total_cost_usd == Decimal("0.5982")
+
+    @pytest.mark.parametrize("model", MODELS)
+    @pytest.mark.parametrize("include_market_data", [True, False])
+    def test_estimate_ask_matches_decimal(self, model, include_market_data):
+        """Test Q&A estimates against Decimal math on the token counts."""
+        estimator = CostEstimator(model)
+        estimate = estimator.estimate_ask(7, include_market_data=include_market_data)
+
+        assert estimate.total_cost_usd == _decimal_cost(
+            estimator.pricing, estimate.total_input_tokens, estimate.total_output_tokens
+        )
@@ -0,0 +1,65 @@
+"""Tests for analysis exporters."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from consilium.core.enums import ConfidenceLevel, SignalType
+from consilium.core.models import AnalysisResult, ConsensusResult
+from consilium.core.serialization import loads
+from consilium.output.exporters import export_all
+
+
+def _analysis(responses) -> AnalysisResult:
+    results = []
+    if responses:
+        results.append(
+            ConsensusResult(
+                ticker="AAPL",
+                final_signal=SignalType.BUY,
+                signal_score=Decimal("40"),
+                confidence=ConfidenceLevel.HIGH,
+                buy_votes=2,
+                sell_votes=1,
+                hold_votes=1,
+                weighted_score=Decimal("40"),
+                agent_responses=responses,
+                consensus_reasoning="Majority bullish.",
+            )
+        )
+    return AnalysisResult(
+        tickers=["AAPL"],
+        results=results,
+        execution_time_seconds=Decimal("1.5"),
+        agents_used=len(responses),
+        started_at=datetime(2024, 1, 2, 9, 30),
+    )
+
+
+class TestExportAll:
+    """Test suite for export_all."""
+
+    def test_writes_every_format(self, tmp_path, sample_agent_responses):
+        """Test that json, csv and md files are written and returned in order."""
+        base = tmp_path / "analysis"
+        paths = export_all(_analysis(sample_agent_responses), base)
+
+        assert paths == [base.with_suffix(ext) for ext in (".json", ".csv", ".md")]
+        assert all(path.stat().st_size > 0 for path in paths)
+        assert loads(paths[0].read_bytes())["tickers"] == ["AAPL"]
+        assert len(paths[1].read_text().splitlines()) == len(sample_agent_responses) + 1
+        assert "AAPL" in paths[2].read_text()
+
+    def test_skips_csv_without_agent_responses(self, tmp_path):
+        """Test that a CSV with nothing to write is neither created nor returned."""
+        base = tmp_path / "empty"
+        paths = export_all(_analysis([]), base, formats=("json", "csv"))
+
+        assert paths == [base.with_suffix(".json")]
+        assert not base.with_suffix(".csv").exists()
+
+    def test_unknown_format(self, tmp_path, sample_agent_responses):
+        """Test that an unknown format is reported."""
+        with pytest.raises(ValueError):
+            export_all(_analysis(sample_agent_responses), tmp_path / "x", formats=("xml",))
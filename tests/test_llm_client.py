@@ -0,0 +1,118 @@
+"""Tests for the Claude client wrapper."""
+
+from types import SimpleNamespace
+
+import pytest
+from anthropic import (
+    APIConnectionError,
+    AuthenticationError,
+    BadRequestError,
+    OverloadedError,
+    RateLimitError,
+)
+from tenacity import wait_none
+
+from consilium.config import Settings
+from consilium.core.exceptions import LLMError
+from consilium.llm.client import ClaudeClient
+
+
+def _api_error(cls: type[Exception], status_code: int | None = None) -> Exception:
+    """Build an SDK exception without the HTTP request/response it normally wraps."""
+    error = cls.__new__(cls)
+    Exception.__init__(error, cls.__name__)
+    if status_code is not None:
+        error.status_code = status_code  # type: ignore[attr-defined]
+    return error
+
+
+@pytest.fixture
+def client() -> ClaudeClient:
+    """Client with a dummy key; tests never reach the network."""
+    return ClaudeClient(Settings(ANTHROPIC_API_KEY="sk-ant-test"))
+
+
+@pytest.fixture
+def no_wait(monkeypatch):
+    """Skip the backoff between retry attempts."""
+    monkeypatch.setattr(ClaudeClient._complete_raw.retry, "wait", wait_none())
+
+
+def _stub_create(client: ClaudeClient, outcomes: list[Exception | str]) -> list[int]:
+    """Make each API call raise or return the next outcome; returns a call counter."""
+    calls: list[int] = []
+
+    async def create(**kwargs):
+        calls.append(1)
+        outcome = outcomes[len(calls) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return SimpleNamespace(content=[SimpleNamespace(text=outcome)])
+
+    client._create = create
+    return calls
+
+
+class TestRetries:
+    """Test suite for retrying transient API errors."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            _api_error(OverloadedError, 529),
+            _api_error(RateLimitError, 429),
+            _api_error(APIConnectionError),
+        ],
+    )
+    async def test_transient_errors_are_retried(self, client, no_wait, error):
+        """Test that overloaded, rate-limited and connection failures are retried."""
+        calls = _stub_create(client, [error, error, '{"ok": true}'])
+        assert await client.complete("system", "user") == {"ok": True}
+        assert len(calls) == 3
+
+    async def test_gives_up_after_three_attempts(self, client, no_wait):
+        """Test that a persistent transient error surfaces as LLMError."""
+        error = _api_error(OverloadedError, 529)
+        calls = _stub_create(client, [error, error, error])
+        with pytest.raises(LLMError):
+            await client.complete("system", "user")
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            _api_error(BadRequestError, 400),
+            _api_error(AuthenticationError, 401),
+        ],
+    )
+    async def test_client_errors_are_not_retried(self, client, no_wait, error):
+        """Test that bad request and auth failures fail on the first attempt."""
+        calls = _stub_create(client, [error, '{"ok": true}'])
+        with pytest.raises(LLMError):
+            await client.complete("system", "user")
+        assert len(calls) == 1
+
+    async def test_invalid_json_is_not_retried(self, client, no_wait):
+        """Test that a malformed response is not re-requested."""
+        calls = _stub_create(client, ["not json", '{"ok": true}'])
+        with pytest.raises(LLMError, match="Failed to parse JSON"):
+            await client.complete("system", "user")
+        assert len(calls) == 1
+
+
+class TestParseJsonResponse:
+    """Test suite for ClaudeClient._parse_json_response."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '{"signal": "buy"}',
+            '```json\n{"signal": "buy"}\n```',
+            '```\n{"signal": "buy"}\n```',
+            '  \n```json\n{"signal": "buy"}\n```\n  ',
+            '\n\t{"signal": "buy"}  \n',
+        ],
+    )
+    def test_fenced_bare_and_padded(self, client, content):
+        """Test that fences and surrounding whitespace are stripped before parsing."""
+        assert client._parse_json_response(content) == {"signal": "buy"}
@@ -0,0 +1,44 @@
+"""Tests for schema migration SQL."""
+
+import sqlite3
+
+from consilium.db.migrations import MIGRATIONS
+
+
+def _statements(version: int) -> list[str]:
+    """Split a migration the way apply_migration does."""
+    return [s.strip() for s in MIGRATIONS[version].split(";") if s.strip()]
+
+
+class TestCacheDedupeMigration:
+    """Test suite for the v10 market_data_cache dedupe."""
+
+    def test_keeps_newest_row_per_key(self):
+        """Test that only the latest row for each ticker/data_type survives."""
+        dedupe = next(s for s in _statements(10) if "DELETE FROM market_data_cache" in s)
+        db = sqlite3.connect(":memory:")
+        db.execute(
+            "CREATE TABLE market_data_cache ("
+            "id INTEGER PRIMARY KEY, ticker TEXT, data_type TEXT, data_json TEXT)"
+        )
+        db.executemany(
+            "INSERT INTO market_data_cache (ticker, data_type, data_json) VALUES (?, ?, ?)",
+            [
+                ("AAPL", "quote", "old"),
+                ("AAPL", "news", "only"),
+                ("AAPL", "quote", "new"),
+                ("MSFT", "quote", "old"),
+                ("MSFT", "quote", "new"),
+            ],
+        )
+
+        db.execute(dedupe)
+
+        rows = db.execute(
+            "SELECT ticker, data_type, data_json FROM market_data_cache ORDER BY id"
+        ).fetchall()
+        assert rows == [
+            ("AAPL", "news", "only"),
+            ("AAPL", "quote", "new"),
+            ("MSFT", "quote", "new"),
+        ]
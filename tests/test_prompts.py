@@ -0,0 +1,60 @@
+"""Tests for prompt formatting helpers and the prompt builder."""
+
+from decimal import Decimal
+
+import pytest
+
+from consilium.llm.prompts import PromptBuilder, _format_number
+
+
+class TestFormatNumber:
+    """Test suite for _format_number."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (Decimal("0.1234"), "12.3%"),
+            (0.5, "50.0%"),
+            (1, "100.0%"),
+            ("0.25", "25.0%"),
+        ],
+    )
+    def test_numeric_values(self, value, expected):
+        """Test that numbers and numeric strings are scaled and formatted."""
+        assert _format_number(value, "{:.1f}%", 100) == expected
+
+    @pytest.mark.parametrize("value", [None, "n/a", [1], {"a": 1}, Decimal("sNaN")])
+    def test_non_numeric_values(self, value):
+        """Test that missing, unhashable and signalling-NaN values give N/A."""
+        assert _format_number(value, "${:,.0f}", 1) == "N/A"
+
+
+class TestInvestorAnalysisPromptCache:
+    """Test suite for PromptBuilder.build_investor_analysis_prompt caching."""
+
+    def test_equal_content_is_rendered_once(self, sample_stock, sample_specialist_reports):
+        """Test that copies of the same stock and reports share one cached prompt."""
+        builder = PromptBuilder()
+        first = builder.build_investor_analysis_prompt(sample_stock, sample_specialist_reports)
+        again = builder.build_investor_analysis_prompt(
+            sample_stock.model_copy(deep=True), list(sample_specialist_reports)
+        )
+
+        assert again == first
+        assert len(builder._analysis_prompts) == 1
+
+    def test_in_place_mutation_is_not_served_stale(self, sample_stock, sample_specialist_reports):
+        """Test that changing the price or the reports of the same objects re-renders."""
+        builder = PromptBuilder()
+        builder.build_investor_analysis_prompt(sample_stock, sample_specialist_reports)
+
+        sample_stock.price.current = Decimal("123.45")
+        assert "$123.45" in builder.build_investor_analysis_prompt(
+            sample_stock, sample_specialist_reports
+        )
+
+        sample_specialist_reports.pop()
+        assert builder.build_investor_analysis_prompt(
+            sample_stock, sample_specialist_reports
+        ) == builder._render_investor_analysis_prompt(sample_stock, sample_specialist_reports)
+        assert len(builder._analysis_prompts) == 3
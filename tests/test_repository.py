@@ -0,0 +1,272 @@
+"""Tests for repository behaviour that does not need a live database."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Any
+
+import pytest
+from aiomysql.cursors import RE_INSERT_VALUES
+from pymysql.err import IntegrityError, OperationalError
+
+from consilium.db import repository
+from consilium.db.repository import (
+    CacheRepository,
+    PriceHistoryRepository,
+    WatchlistRepository,
+)
+
+
+class FakePool:
+    """Records statements and replays scripted failures."""
+
+    def __init__(
+        self,
+        batch_error: Exception | None = None,
+        row_errors: dict[int, Exception] | None = None,
+    ) -> None:
+        self.batch_error = batch_error
+        self.row_errors = row_errors or {}
+        self.executed: list[tuple[Any, ...]] = []
+        self.calls = 0
+
+    async def execute_many(self, query: str, rows: list[tuple[Any, ...]]) -> int:
+        if self.batch_error:
+            raise self.batch_error
+        self.executed.extend(rows)
+        return len(rows)
+
+    async def execute(self, query: str, params: tuple[Any, ...] | None = None) -> tuple[int, int]:
+        index = self.calls
+        self.calls += 1
+        if index in self.row_errors:
+            raise self.row_errors[index]
+        self.executed.append(params or ())
+        return 1, 0
+
+
+class FakeCachePool:
+    """Keeps market_data_cache rows in a dict keyed like the unique index."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], tuple[str, int]] = {}
+        self.fetches = 0
+
+    async def execute(self, query: str, params: tuple[Any, ...] | None = None) -> tuple[int, int]:
+        assert params is not None
+        if query.lstrip().startswith("INSERT"):
+            ticker, data_type, data_json, ttl_minutes = params
+            self.rows[(ticker, data_type)] = (data_json, ttl_minutes)
+            return 1, 0
+        keys = [k for k in self.rows if k[0] == params[0] and params[1:] in ((), (k[1],))]
+        for key in keys:
+            del self.rows[key]
+        return len(keys), 0
+
+    async def fetch_one(self, query: str, params: tuple[Any, ...]) -> dict[str, Any] | None:
+        self.fetches += 1
+        row = self.rows.get(params)
+        if row is None:
+            return None
+        return {"data_json": row[0], "ttl_seconds": row[1] * 60}
+
+
+class FakeCursor:
+    """Cursor whose UPDATEs change nothing and whose SELECTs find `existing`."""
+
+    def __init__(self, existing: set[str]) -> None:
+        self.existing = existing
+        self.rowcount = 0
+        self.row: tuple[int] | None = None
+
+    async def __aenter__(self) -> "FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    async def execute(self, query: str, params: tuple[Any, ...]) -> None:
+        self.rowcount = 0
+        self.row = (1,) if params[-1] in self.existing else None
+
+    async def fetchone(self) -> tuple[int] | None:
+        return self.row
+
+
+class FakeConnection:
+    """Connection that opens FakeCursors."""
+
+    def __init__(self, existing: set[str]) -> None:
+        self.existing = existing
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self.existing)
+
+
+class FakeConnectionPool:
+    """Hands out FakeConnections."""
+
+    def __init__(self, existing: set[str]) -> None:
+        self.existing = existing
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[FakeConnection]:
+        yield FakeConnection(self.existing)
+
+
+def _prices(count: int) -> list[dict[str, Any]]:
+    return [{"date": date(2024, 1, day), "close": 100 + day} for day in range(1, count + 1)]
+
+
+class TestPriceHistoryRepository:
+    """Test suite for PriceHistoryRepository.save_prices."""
+
+    def test_upsert_is_rewritten_as_multi_row_insert(self):
+        """Test that execute_many can fold the upsert into one multi-row statement."""
+        assert RE_INSERT_VALUES.match(repository._UPSERT_PRICE_SQL)
+
+    async def test_batch_insert(self):
+        """Test that all rows go through one batch when it succeeds."""
+        pool = FakePool()
+        assert await PriceHistoryRepository(pool).save_prices("aapl", _prices(3)) == 3
+        assert [row[0] for row in pool.executed] == ["AAPL"] * 3
+
+    async def test_falls_back_row_by_row_and_logs(self, caplog):
+        """Test that a data error in the batch is logged and bad rows are skipped."""
+        pool = FakePool(
+            batch_error=IntegrityError(1048, "bad row"),
+            row_errors={1: IntegrityError(1048, "bad row")},
+        )
+        with caplog.at_level("WARNING", logger="consilium.db.repository"):
+            inserted = await PriceHistoryRepository(pool).save_prices("AAPL", _prices(3))
+
+        assert inserted == 2
+        assert "retrying row by row" in caplog.text
+
+    async def test_connection_errors_are_not_retried(self):
+        """Test that operational errors propagate instead of a per-row fallback."""
+        pool = FakePool(batch_error=OperationalError(2013, "Lost connection"))
+        with pytest.raises(OperationalError):
+            await PriceHistoryRepository(pool).save_prices("AAPL", _prices(3))
+        assert pool.executed == []
+
+
+class TestCacheRepository:
+    """Test suite for CacheRepository and its in-process LRU."""
+
+    def test_upsert_is_rewritten_as_multi_row_insert(self):
+        """Test that mset_cached's execute_many can fold rows into one statement."""
+        assert RE_INSERT_VALUES.match(repository._UPSERT_CACHE_SQL)
+
+    async def test_set_cached_twice_upserts(self):
+        """Test that a second set_cached replaces the single row's data and TTL."""
+        pool = FakeCachePool()
+        cache = CacheRepository(pool)
+        await cache.set_cached("AAPL", "quote", {"price": 1}, ttl_minutes=5)
+        await cache.set_cached("aapl", "quote", {"price": 2}, ttl_minutes=10)
+
+        assert list(pool.rows) == [("AAPL", "quote")]
+        assert pool.rows[("AAPL", "quote")] == ('{"price":2}', 10)
+
+    async def test_get_cached_returns_upserted_value(self):
+        """Test that a database read sees the latest upserted data."""
+        pool = FakeCachePool()
+        await CacheRepository(pool).set_cached("AAPL", "quote", {"price": 1})
+        await CacheRepository(pool).set_cached("AAPL", "quote", {"price": 2})
+
+        assert await CacheRepository(pool).get_cached("AAPL", "quote") == {"price": 2}
+        assert pool.fetches == 1
+
+    async def test_hit_within_ttl_skips_database(self):
+        """Test that a fresh local entry is served without a query."""
+        pool = FakeCachePool()
+        cache = CacheRepository(pool)
+        await cache.set_cached("aapl", "quote", {"price": 1})
+
+        assert await cache.get_cached("AAPL", "quote") == {"price": 1}
+        assert pool.fetches == 0
+
+    async def test_returned_data_is_a_copy(self):
+        """Test that mutating a result or the stored dict does not change the cache."""
+        cache = CacheRepository(FakeCachePool())
+        data = {"price": 1, "history": [1, 2]}
+        await cache.set_cached("AAPL", "quote", data)
+        data["history"].append(3)
+
+        first = await cache.get_cached("AAPL", "quote")
+        first["price"] = 99
+        assert await cache.get_cached("AAPL", "quote") == {"price": 1, "history": [1, 2]}
+
+    async def test_ttl_clamped_to_local_limit(self, monkeypatch):
+        """Test that local entries expire after LOCAL_CACHE_TTL_SECONDS even with a long TTL."""
+        now = [1000.0]
+        monkeypatch.setattr(repository.time, "monotonic", lambda: now[0])
+        pool = FakeCachePool()
+        cache = CacheRepository(pool)
+        await cache.set_cached("AAPL", "quote", {"price": 1}, ttl_minutes=60)
+
+        now[0] += CacheRepository.LOCAL_CACHE_TTL_SECONDS - 1
+        await cache.get_cached("AAPL", "quote")
+        assert pool.fetches == 0
+
+        now[0] += 1
+        assert await cache.get_cached("AAPL", "quote") == {"price": 1}
+        assert pool.fetches == 1
+
+    async def test_lru_evicts_oldest(self, monkeypatch):
+        """Test that the least recently used entry is dropped at LOCAL_CACHE_SIZE."""
+        monkeypatch.setattr(CacheRepository, "LOCAL_CACHE_SIZE", 2)
+        pool = FakeCachePool()
+        cache = CacheRepository(pool)
+        await cache.set_cached("AAPL", "quote", {"n": 1})
+        await cache.set_cached("MSFT", "quote", {"n": 2})
+        await cache.get_cached("AAPL", "quote")
+        await cache.set_cached("NVDA", "quote", {"n": 3})
+
+        await cache.get_cached("AAPL", "quote")
+        await cache.get_cached("NVDA", "quote")
+        assert pool.fetches == 0
+        await cache.get_cached("MSFT", "quote")
+        assert pool.fetches == 1
+
+    async def test_invalidate_data_type(self):
+        """Test that invalidating one data type keeps the ticker's other entries."""
+        pool = FakeCachePool()
+        cache = CacheRepository(pool)
+        await cache.set_cached("AAPL", "quote", {"n": 1})
+        await cache.set_cached("AAPL", "news", {"n": 2})
+
+        assert await cache.invalidate("aapl", "quote") == 1
+        assert await cache.get_cached("AAPL", "quote") is None
+        assert await cache.get_cached("AAPL", "news") == {"n": 2}
+        assert pool.fetches == 1
+
+    async def test_invalidate_ticker(self):
+        """Test that invalidating a ticker drops all of its local entries."""
+        pool = FakeCachePool()
+        cache = CacheRepository(pool)
+        await cache.set_cached("AAPL", "quote", {"n": 1})
+        await cache.set_cached("AAPL", "news", {"n": 2})
+        await cache.set_cached("MSFT", "quote", {"n": 3})
+
+        assert await cache.invalidate("AAPL") == 2
+        assert await cache.get_cached("AAPL", "quote") is None
+        assert await cache.get_cached("AAPL", "news") is None
+        assert await cache.get_cached("MSFT", "quote") == {"n": 3}
+        assert pool.fetches == 2
+
+
+class TestWatchlistRepository:
+    """Test suite for WatchlistRepository ticker updates."""
+
+    async def test_noop_update_on_existing_watchlist(self):
+        """Test that an unchanged watchlist still counts as found."""
+        repo = WatchlistRepository(FakeConnectionPool({"tech"}))
+        assert await repo.add_tickers("tech", ["AAPL"]) is True
+        assert await repo.remove_tickers("tech", ["MSFT"]) is True
+
+    async def test_missing_watchlist(self):
+        """Test that updating an unknown watchlist reports not found."""
+        repo = WatchlistRepository(FakeConnectionPool(set()))
+        assert await repo.add_tickers("nope", ["AAPL"]) is False
+        assert await repo.remove_tickers("nope", ["AAPL"]) is False
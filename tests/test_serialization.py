@@ -0,0 +1,26 @@
+"""Tests for JSON serialization helpers."""
+
+from decimal import Decimal
+
+from consilium.core.serialization import dumps, dumps_indented, loads
+
+
+class TestSerialization:
+    """Test suite for dumps/loads."""
+
+    def test_dumps_returns_str(self):
+        """Test that dumps returns text suitable for JSON columns."""
+        assert dumps(["AAPL", "MSFT"]) == '["AAPL","MSFT"]'
+
+    def test_dumps_falls_back_to_str(self):
+        """Test that unsupported types such as Decimal are stringified."""
+        assert loads(dumps({"price": Decimal("180.50")})) == {"price": "180.50"}
+
+    def test_round_trip(self):
+        """Test that dumps/loads round-trip nested structures."""
+        data = {"tickers": ["AAPL"], "score": 65.5, "nested": {"ok": True}}
+        assert loads(dumps(data)) == data
+
+    def test_dumps_indented_writes_decimal_as_float(self):
+        """Test that export serialization indents and keeps Decimal numeric."""
+        assert dumps_indented({"score": Decimal("65.5")}) == b'{\n  "score": 65.5\n}'